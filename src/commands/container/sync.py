@@ -7,6 +7,7 @@ import json
 import os
 import shutil
 import stat
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
@@ -92,6 +93,46 @@ def make_secure_dir(path: Path) -> None:
         pass  # May fail on some filesystems
 
 
+def atomic_copy(src: Path, dst: Path) -> None:
+    """
+    Copy src over dst so readers only ever see the old or the new file.
+
+    The copy lands in a temp file next to dst (same filesystem, so the
+    rename is atomic), is fsynced and given FILE_PERMISSIONS, then replaces
+    dst. The parent directory is fsynced too so the rename survives a crash.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        shutil.copy2(src, tmp_path)
+        try:
+            tmp_path.chmod(FILE_PERMISSIONS)
+        except OSError:
+            pass
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, dst)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Directory fsync is POSIX-only (Windows has no O_DIRECTORY) and
+    # best-effort: some filesystems refuse to open or fsync a directory,
+    # and dst has already been replaced by then
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(dst.parent, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
 def get_container_claude_dir() -> Path:
     """Get the Claude config directory in the container."""
     # Check CLAUDE_CONFIG_DIR first
@@ -138,10 +179,16 @@ def get_jsonl_files(claude_dir: Path) -> list[Path]:
     """Get all JSONL data files from Claude directory."""
     files = []
 
-    # Check data/ directory
-    data_dir = claude_dir / "data"
-    if data_dir.exists():
-        files.extend(data_dir.glob("*.jsonl"))
+    # Check data/ directory: one dirent pass with a suffix test instead of
+    # an exists() probe plus a compiled glob
+    try:
+        with os.scandir(claude_dir / "data") as entries:
+            files.extend(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".jsonl") and entry.is_file()
+            )
+    except OSError:
+        pass
 
     # Check root history.jsonl
     history_file = claude_dir / "history.jsonl"
@@ -158,18 +205,21 @@ def get_jsonl_files(claude_dir: Path) -> list[Path]:
 
 def get_projects_data(claude_dir: Path) -> dict:
     """Get project-specific data directories."""
-    projects_dir = claude_dir / "projects"
-    if not projects_dir.exists():
-        return {}
-
     projects = {}
-    for project_dir in projects_dir.iterdir():
-        if project_dir.is_dir():
-            projects[project_dir.name] = {
-                "path": project_dir,
-                "has_data": (project_dir / "data").exists(),
-                "has_memory": (project_dir / "CLAUDE.md").exists(),
-            }
+    try:
+        # DirEntry.is_dir() answers from the dirent type on Linux/macOS, so
+        # only actual project directories pay for the two exists() probes
+        with os.scandir(claude_dir / "projects") as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    project_dir = Path(entry.path)
+                    projects[entry.name] = {
+                        "path": project_dir,
+                        "has_data": (project_dir / "data").exists(),
+                        "has_memory": (project_dir / "CLAUDE.md").exists(),
+                    }
+    except OSError:
+        return {}
     return projects
 
 
@@ -235,26 +285,25 @@ def sync_jsonl_to_host(container_dir: Path, host_dir: Path, dry_run: bool = Fals
                 continue
 
             if host_file.exists():
-                # Merge with existing host file
-                host_records = []
+                # Merge with existing host file. Deduplicate by timestamp +
+                # session + uuid (more robust); only the keys are kept, the
+                # host file is streamed rather than held in memory.
+                existing_keys = set()
                 with open(host_file, encoding="utf-8") as f:
                     for line in f:
-                        if line.strip():
-                            try:
-                                host_records.append(json.loads(line))
-                            except json.JSONDecodeError:
-                                pass  # Skip malformed lines in host file
-
-                # Deduplicate by timestamp + session + uuid (more robust)
-                existing_keys = set()
-                for r in host_records:
-                    # Use uuid if available, fall back to timestamp+session
-                    uuid = r.get("uuid", "")
-                    ts = r.get("timestamp", "")
-                    session = r.get("sessionId", "")
-                    key = (uuid, ts, session) if uuid else (ts, session, "")
-                    if key != ("", "", ""):  # Skip records with no identifying info
-                        existing_keys.add(key)
+                        if not line.strip():
+                            continue
+                        try:
+                            r = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # Skip malformed lines in host file
+                        # Use uuid if available, fall back to timestamp+session
+                        uuid = r.get("uuid", "")
+                        ts = r.get("timestamp", "")
+                        session = r.get("sessionId", "")
+                        key = (uuid, ts, session) if uuid else (ts, session, "")
+                        if key != ("", "", ""):  # Skip records with no identifying info
+                            existing_keys.add(key)
 
                 new_records = []
                 for r in container_records:
@@ -334,12 +383,9 @@ def sync_ccg_database(container_dir: Path, host_dir: Path, dry_run: bool = False
                 stats["backup_path"] = str(backup_path)
                 stats["warning"] = "Host database overwritten (backup created). Database merge not yet implemented."
 
-            # Copy the db (merge logic could be added later)
-            shutil.copy2(container_db, host_db)
-            try:
-                host_db.chmod(FILE_PERMISSIONS)
-            except OSError:
-                pass
+            # Copy the db (merge logic could be added later); atomic so a
+            # host process never opens a half-written database
+            atomic_copy(container_db, host_db)
 
         stats["synced"] = True
 
@@ -87,8 +87,8 @@ def run(console: Console, fast: bool = False, force: bool = False) -> None:
     # Cost Summary (if using API pricing)
     if db_stats['total_cost'] > 0:
         # Calculate actual months covered from date range
-        start_date = datetime.strptime(db_stats['oldest_date'], "%Y-%m-%d")
-        end_date = datetime.strptime(db_stats['newest_date'], "%Y-%m-%d")
+        start_date = datetime.fromisoformat(db_stats['oldest_date'])
+        end_date = datetime.fromisoformat(db_stats['newest_date'])
 
         # Count unique months covered
         months_covered = set()
@@ -181,8 +181,8 @@ def run_remote(console: Console) -> None:
         console.print(f"  Date Range:          {db_stats['oldest_date']} to {db_stats['newest_date']}")
 
         if db_stats['total_cost'] > 0:
-            start_date = datetime.strptime(db_stats['oldest_date'], "%Y-%m-%d")
-            end_date = datetime.strptime(db_stats['newest_date'], "%Y-%m-%d")
+            start_date = datetime.fromisoformat(db_stats['oldest_date'])
+            end_date = datetime.fromisoformat(db_stats['newest_date'])
             months_covered = set()
             current = start_date
             while current <= end_date:
@@ -5,7 +5,9 @@ Displays current sync configuration and connection status.
 """
 #region Imports
 import shutil
+import socket
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -26,9 +28,14 @@ def check_onedrive_path(path: str) -> bool:
     return Path(path).exists()
 
 
-def check_fab_auth() -> bool:
-    """Check if Fabric CLI is authenticated."""
-    fab = shutil.which("fab")
+def check_fab_auth(fab: str | None = None) -> bool:
+    """
+    Check if Fabric CLI is authenticated.
+
+    Args:
+        fab: Already-resolved fab executable; looked up on PATH when omitted
+    """
+    fab = fab or shutil.which("fab")
     if not fab:
         return False
 
@@ -44,6 +51,50 @@ def check_fab_auth() -> bool:
         return False
 
 
+def _probe_fab() -> tuple[str | None, bool]:
+    """Resolve fab once and check its login; (None, False) when not installed."""
+    fab = shutil.which("fab")
+    return fab, bool(fab) and check_fab_auth(fab)
+
+
+def _probe_reachable(host: str, port: int) -> bool | None:
+    """
+    TCP connect to the quack endpoint; None when the host can't be resolved.
+
+    An in-process connect replaces spawning ping, whose timeout flag differs
+    between macOS and Linux, and checks the quack port itself rather than
+    ICMP reachability of the host.
+    """
+    try:
+        with socket.create_connection((host.split(":")[0], port), timeout=2):
+            return True
+    except socket.gaierror:
+        return None
+    except OSError:
+        return False
+
+
+def _start_probes(
+    pool: ThreadPoolExecutor,
+    sync_configs: dict[str, dict[str, Any]],
+) -> dict[str, Future[Any]]:
+    """
+    Submit every provider's slow probe (subprocess/network) to pool.
+
+    The probes are independent and I/O-bound, so the status output waits
+    on the slowest one instead of their sum.
+    """
+    probes: dict[str, Future[Any]] = {}
+    if "onelake" in sync_configs:
+        probes["onelake"] = pool.submit(_probe_fab)
+    if "quack" in sync_configs:
+        quack_config = sync_configs["quack"]
+        probes["quack"] = pool.submit(
+            _probe_reachable, quack_config.get("host", "Not set"), quack_config.get("port", 9494)
+        )
+    return probes
+
+
 def _panel_table(title: str) -> Table:
     table = Table(title=title, show_header=False, box=None, padding=(0, 2))
     table.add_column("Key", style="bold")
@@ -62,7 +113,12 @@ def _print_onedrive_panel(console: Console, sync_config: dict[str, Any]) -> None
     console.print(table)
 
 
-def _print_onelake_panel(console: Console, sync_config: dict[str, Any], db_path: Path) -> None:
+def _print_onelake_panel(
+    console: Console,
+    sync_config: dict[str, Any],
+    db_path: Path,
+    fab_probe: Future[tuple[str | None, bool]] | None = None,
+) -> None:
     table = _panel_table("OneLake Status")
     table.add_row("Workspace", sync_config.get("workspace", "Not set"))
     table.add_row("Lakehouse", sync_config.get("lakehouse", "Not set"))
@@ -91,10 +147,9 @@ def _print_onelake_panel(console: Console, sync_config: dict[str, Any], db_path:
         except Exception:
             pass
 
-    fab_installed = shutil.which("fab") is not None
-    table.add_row("Fabric CLI", "[green]Installed[/green]" if fab_installed else "[yellow]Not found[/yellow]")
-    if fab_installed:
-        authenticated = check_fab_auth()
+    fab, authenticated = fab_probe.result() if fab_probe else _probe_fab()
+    table.add_row("Fabric CLI", "[green]Installed[/green]" if fab else "[yellow]Not found[/yellow]")
+    if fab:
         table.add_row(
             "Authentication",
             "[green]Logged in[/green]" if authenticated else "[red]Not logged in[/red]",
@@ -111,7 +166,11 @@ def _print_motherduck_panel(console: Console, sync_config: dict[str, Any]) -> No
     console.print(table)
 
 
-def _print_quack_panel(console: Console, sync_config: dict[str, Any]) -> None:
+def _print_quack_panel(
+    console: Console,
+    sync_config: dict[str, Any],
+    reachable_probe: Future[bool | None] | None = None,
+) -> None:
     table = _panel_table("Quack Remote Status")
     host = sync_config.get("host", "Not set")
     port = sync_config.get("port", 9494)
@@ -122,15 +181,11 @@ def _print_quack_panel(console: Console, sync_config: dict[str, Any]) -> None:
     table.add_row("SSL", "[yellow]Disabled[/yellow] (WireGuard encrypts)" if disable_ssl else "[green]Enabled[/green]")
     table.add_row("Token Source", token_source)
 
-    try:
-        result = subprocess.run(
-            ["ping", "-c", "1", "-t", "2", host.split(":")[0]],
-            capture_output=True, timeout=3,
-        )
-        reachable = result.returncode == 0
-        table.add_row("Reachable", "[green]Yes[/green]" if reachable else "[red]No[/red]")
-    except Exception:
+    reachable = reachable_probe.result() if reachable_probe else _probe_reachable(host, port)
+    if reachable is None:
         table.add_row("Reachable", "[yellow]Unknown[/yellow]")
+    else:
+        table.add_row("Reachable", "[green]Yes[/green]" if reachable else "[red]No[/red]")
 
     console.print()
     console.print(table)
@@ -160,65 +215,71 @@ def sync_status_command() -> None:
     device_name = user_config.get_device_name()
     device_type = user_config.get_device_type_config()
 
-    # Build status table
-    table = Table(
-        title="Sync Configuration",
-        show_header=False,
-        box=None,
-        padding=(0, 2),
-    )
-    table.add_column("Key", style="bold")
-    table.add_column("Value")
-
-    # Storage info
-    storage_names = {"sqlite": "SQLite", "duckdb": "DuckDB"}
-    table.add_row("Storage", storage_names.get(storage_format, storage_format))
-
-    # Determine database path
-    usage_dir = Path.home() / ".claude" / "usage"
-    if device_id:
-        db_ext = ".db" if storage_format == "sqlite" else ".duckdb"
-        db_path = usage_dir / f"{device_id}{db_ext}"
-    else:
-        db_path = usage_dir / "usage_history.db"
-
-    table.add_row("Path", str(db_path))
-    table.add_row("", "")
-
-    # Provider info
-    provider_names = {
-        "quack": "Quack (DuckDB remote)",
-        "onedrive": "OneDrive (local folder)",
-        "onelake": "OneLake (Fabric)",
-        "motherduck": "MotherDuck (cloud)",
-    }
-    table.add_row(
-        "Providers",
-        ", ".join(provider_names.get(p, p) for p in providers) if providers else "None (local only)",
-    )
-
-    # Device info
-    if device_id:
-        table.add_row("Device ID", device_id)
-    if device_name:
-        table.add_row("Device Name", device_name)
-    if device_type:
-        table.add_row("Device Type", device_type)
+    # Kick off the slow provider probes now so they run while the tables
+    # below are built; the with block joins the workers on any exit
+    sync_configs = {provider: user_config.get_sync_config(provider) for provider in providers}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        probes = _start_probes(pool, sync_configs)
+
+        # Build status table
+        table = Table(
+            title="Sync Configuration",
+            show_header=False,
+            box=None,
+            padding=(0, 2),
+        )
+        table.add_column("Key", style="bold")
+        table.add_column("Value")
+
+        # Storage info
+        storage_names = {"sqlite": "SQLite", "duckdb": "DuckDB"}
+        table.add_row("Storage", storage_names.get(storage_format, storage_format))
+
+        # Determine database path
+        usage_dir = Path.home() / ".claude" / "usage"
+        if device_id:
+            db_ext = ".db" if storage_format == "sqlite" else ".duckdb"
+            db_path = usage_dir / f"{device_id}{db_ext}"
+        else:
+            db_path = usage_dir / "usage_history.db"
+
+        table.add_row("Path", str(db_path))
+        table.add_row("", "")
+
+        # Provider info
+        provider_names = {
+            "quack": "Quack (DuckDB remote)",
+            "onedrive": "OneDrive (local folder)",
+            "onelake": "OneLake (Fabric)",
+            "motherduck": "MotherDuck (cloud)",
+        }
+        table.add_row(
+            "Providers",
+            ", ".join(provider_names.get(p, p) for p in providers) if providers else "None (local only)",
+        )
 
-    console.print()
-    console.print(table)
+        # Device info
+        if device_id:
+            table.add_row("Device ID", device_id)
+        if device_name:
+            table.add_row("Device Name", device_name)
+        if device_type:
+            table.add_row("Device Type", device_type)
 
-    # One panel per configured provider so multi-sink setups show every sink
-    for provider in providers:
-        sync_config = user_config.get_sync_config(provider)
-        if provider == "onedrive":
-            _print_onedrive_panel(console, sync_config)
-        elif provider == "onelake":
-            _print_onelake_panel(console, sync_config, db_path)
-        elif provider == "motherduck":
-            _print_motherduck_panel(console, sync_config)
-        elif provider == "quack":
-            _print_quack_panel(console, sync_config)
+        console.print()
+        console.print(table)
+
+        # One panel per configured provider so multi-sink setups show every sink
+        for provider in providers:
+            sync_config = sync_configs[provider]
+            if provider == "onedrive":
+                _print_onedrive_panel(console, sync_config)
+            elif provider == "onelake":
+                _print_onelake_panel(console, sync_config, db_path, probes.get("onelake"))
+            elif provider == "motherduck":
+                _print_motherduck_panel(console, sync_config)
+            elif provider == "quack":
+                _print_quack_panel(console, sync_config, probes.get("quack"))
 
     if not providers:
         console.print()
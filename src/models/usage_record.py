@@ -83,7 +83,8 @@ class UsageRecord:
             Date string in YYYY-MM-DD format (local timezone)
         """
         local_timestamp = self.timestamp.astimezone()  # Convert to local timezone
-        return local_timestamp.strftime("%Y-%m-%d")
+        # Same YYYY-MM-DD as strftime, without its per-call format parsing
+        return local_timestamp.date().isoformat()
 
     @property
     def is_user_prompt(self) -> bool:
@@ -5,7 +5,13 @@ Mirrors the snapshot_db.py API but uses DuckDB for storage.
 Required for MotherDuck cloud sync and analytical queries.
 """
 #region Imports
-from datetime import datetime
+import ctypes
+import functools
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 
 try:
@@ -26,6 +32,17 @@ DEFAULT_DB_PATH = Path.home() / ".claude" / "usage" / "usage_history.duckdb"
 # write path; the DDL + pricing seed cost is worth paying once per process,
 # not once per call.
 _INITIALIZED_DBS: set[str] = set()
+
+# Below this many files the stale scan stats serially; thread pool setup
+# costs more than the overlapped syscalls save
+_PARALLEL_STAT_MIN_FILES = 64
+
+# Paths bound per `file_path IN (...)` file_metadata delete
+PATH_PARAM_CHUNK = 500
+
+# From this many deleted paths (with pyarrow) the delete joins a registered
+# Arrow relation instead of binding inline placeholders
+_ARROW_DELETE_MIN_PATHS = 32
 #endregion
 
 
@@ -52,7 +69,7 @@ def require_duckdb() -> None:
 #region Database Functions
 
 
-def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
+def init_database(db_path: Path = DEFAULT_DB_PATH, conn: "duckdb.DuckDBPyConnection | None" = None) -> None:
     """
     Initialize the DuckDB database for historical snapshots.
 
@@ -65,6 +82,8 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
 
     Args:
         db_path: Path to the DuckDB database file
+        conn: Open connection to db_path to run the DDL on; the caller keeps
+            ownership. When omitted a connection is opened and closed here.
 
     Raises:
         ImportError: If DuckDB is not installed
@@ -77,7 +96,9 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
 
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = duckdb.connect(str(db_path))
+    owns_conn = conn is None
+    if conn is None:
+        conn = duckdb.connect(str(db_path))
     try:
         # Table for daily aggregated snapshots
         conn.execute("""
@@ -98,10 +119,15 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
             )
         """)
 
+        # Create sequence for auto-increment if not exists
+        conn.execute("""
+            CREATE SEQUENCE IF NOT EXISTS usage_records_id_seq START 1
+        """)
+
         # Table for detailed usage records
         conn.execute("""
             CREATE TABLE IF NOT EXISTS usage_records (
-                id INTEGER PRIMARY KEY,
+                id INTEGER PRIMARY KEY DEFAULT nextval('usage_records_id_seq'),
                 date VARCHAR NOT NULL,
                 timestamp VARCHAR NOT NULL,
                 session_id VARCHAR NOT NULL,
@@ -131,10 +157,12 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
             "cache_creation_1h_tokens INTEGER DEFAULT 0"
         )
 
-        # Create sequence for auto-increment if not exists
-        conn.execute("""
-            CREATE SEQUENCE IF NOT EXISTS usage_records_id_seq START 1
-        """)
+        # Existing databases get the id default too, so inserts can omit id
+        # and DuckDB draws sequence values in bulk
+        conn.execute(
+            "ALTER TABLE usage_records ALTER COLUMN id "
+            "SET DEFAULT nextval('usage_records_id_seq')"
+        )
 
         # No explicit date indexes: rows arrive in near-date order, so
         # zonemaps already prune date filters, and an ART index here once
@@ -230,15 +258,19 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
             ('<synthetic>', 0.00, 0.00, 0.00, 0.00, 0.00, 'Test/synthetic model'),
         ]
 
+        # One timestamp for the whole seed, bound through a single prepared
+        # statement rather than re-bound per row
         timestamp = datetime.now().isoformat()
-        for model_name, input_price, output_price, cache_write, cache_read, cache_write_1h, notes in pricing_data:
-            conn.execute("""
-                INSERT OR REPLACE INTO model_pricing (
-                    model_name, input_price_per_mtok, output_price_per_mtok,
-                    cache_write_price_per_mtok, cache_read_price_per_mtok,
-                    cache_write_1h_price_per_mtok, last_updated, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, [model_name, input_price, output_price, cache_write, cache_read, cache_write_1h, timestamp, notes])
+        conn.executemany("""
+            INSERT OR REPLACE INTO model_pricing (
+                model_name, input_price_per_mtok, output_price_per_mtok,
+                cache_write_price_per_mtok, cache_read_price_per_mtok,
+                cache_write_1h_price_per_mtok, last_updated, notes
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            [model_name, input_price, output_price, cache_write, cache_read, cache_write_1h, timestamp, notes]
+            for model_name, input_price, output_price, cache_write, cache_read, cache_write_1h, notes in pricing_data
+        ])
 
         # Per-file aggregate contributions ledger (aggregate storage mode):
         # what each transcript file last added to daily_snapshots, so a
@@ -262,30 +294,35 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
 
         _INITIALIZED_DBS.add(str(db_path))
     finally:
-        conn.close()
+        if owns_conn:
+            conn.close()
 
 
 def _aggregate_by_date(records: list[UsageRecord]) -> dict[str, dict[str, int]]:
-    """Per-date sums (prompts/responses/sessions/token fields) for one file."""
+    """Per-date sums (prompts/responses/sessions/token fields) for a batch of records."""
     sums: dict[str, dict[str, int]] = {}
     sessions: dict[str, set[str]] = {}
     for record in records:
         date = record.date_key
-        day = sums.setdefault(date, {
-            "prompts": 0, "responses": 0, "input_tokens": 0, "output_tokens": 0,
-            "cache_creation_tokens": 0, "cache_read_tokens": 0, "total_tokens": 0,
-        })
-        sessions.setdefault(date, set()).add(record.session_id)
+        day = sums.get(date)
+        if day is None:
+            day = sums[date] = {
+                "prompts": 0, "responses": 0, "input_tokens": 0, "output_tokens": 0,
+                "cache_creation_tokens": 0, "cache_read_tokens": 0, "total_tokens": 0,
+            }
+            sessions[date] = set()
+        sessions[date].add(record.session_id)
         if record.is_user_prompt:
             day["prompts"] += 1
         elif record.is_assistant_response:
             day["responses"] += 1
-        if record.token_usage:
-            day["input_tokens"] += record.token_usage.input_tokens
-            day["output_tokens"] += record.token_usage.output_tokens
-            day["cache_creation_tokens"] += record.token_usage.cache_creation_tokens
-            day["cache_read_tokens"] += record.token_usage.cache_read_tokens
-            day["total_tokens"] += record.token_usage.total_tokens
+        tu = record.token_usage
+        if tu:
+            day["input_tokens"] += tu.input_tokens
+            day["output_tokens"] += tu.output_tokens
+            day["cache_creation_tokens"] += tu.cache_creation_tokens
+            day["cache_read_tokens"] += tu.cache_read_tokens
+            day["total_tokens"] += tu.total_tokens
     for date, day in sums.items():
         day["sessions"] = len(sessions[date])
     return sums
@@ -328,7 +365,7 @@ def save_file_aggregate(
             [str(file_path)],
         ).fetchall()
         previous = {
-            row[0]: dict(zip(_CONTRIB_FIELDS, row[1:])) for row in rows
+            row[0]: dict(zip(_CONTRIB_FIELDS, row[1:], strict=True)) for row in rows
         }
         if not previous:
             tracked = conn.execute(
@@ -489,7 +526,7 @@ def save_snapshot(
                 conn.unregister("staging_arrow")
             else:
                 # Fallback: chunked executemany. Slower but works without pyarrow.
-                rows = list(zip(*cols.values()))
+                rows = list(zip(*cols.values(), strict=True))
                 chunk = 500
                 for i in range(0, len(rows), chunk):
                     batch = rows[i:i + chunk]
@@ -535,7 +572,7 @@ def save_snapshot(
             conn.execute(
                 """
                 INSERT INTO usage_records (
-                    id, date, timestamp, session_id, message_uuid, message_type,
+                    date, timestamp, session_id, message_uuid, message_type,
                     model, folder, git_branch, version,
                     input_tokens, output_tokens,
                     cache_creation_tokens, cache_read_tokens, total_tokens,
@@ -543,7 +580,6 @@ def save_snapshot(
                     device_id, device_name, device_type
                 )
                 SELECT
-                    nextval('usage_records_id_seq'),
                     s.date, s.timestamp, s.session_id, s.message_uuid, s.message_type,
                     s.model, s.folder, s.git_branch, s.version,
                     s.input_tokens, s.output_tokens,
@@ -598,33 +634,7 @@ def save_snapshot(
             conn.execute("DROP TABLE staging_records")
         else:
             # Aggregate mode
-            from collections import defaultdict
-            daily_aggregates = defaultdict(lambda: {
-                "prompts": 0,
-                "responses": 0,
-                "sessions": set(),
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "cache_creation_tokens": 0,
-                "cache_read_tokens": 0,
-                "total_tokens": 0,
-            })
-
-            for record in records:
-                date_key = record.date_key
-                daily_aggregates[date_key]["sessions"].add(record.session_id)
-
-                if record.is_user_prompt:
-                    daily_aggregates[date_key]["prompts"] += 1
-                elif record.is_assistant_response:
-                    daily_aggregates[date_key]["responses"] += 1
-
-                if record.token_usage:
-                    daily_aggregates[date_key]["input_tokens"] += record.token_usage.input_tokens
-                    daily_aggregates[date_key]["output_tokens"] += record.token_usage.output_tokens
-                    daily_aggregates[date_key]["cache_creation_tokens"] += record.token_usage.cache_creation_tokens
-                    daily_aggregates[date_key]["cache_read_tokens"] += record.token_usage.cache_read_tokens
-                    daily_aggregates[date_key]["total_tokens"] += record.token_usage.total_tokens
+            daily_aggregates = _aggregate_by_date(records)
 
             timestamp = datetime.now().isoformat()
             for date_key, agg in daily_aggregates.items():
@@ -646,7 +656,7 @@ def save_snapshot(
                         date_key,
                         existing[0] + agg["prompts"],
                         existing[1] + agg["responses"],
-                        existing[2] + len(agg["sessions"]),
+                        existing[2] + agg["sessions"],
                         existing[3] + agg["total_tokens"],
                         existing[4] + agg["input_tokens"],
                         existing[5] + agg["output_tokens"],
@@ -669,7 +679,7 @@ def save_snapshot(
                         date_key,
                         agg["prompts"],
                         agg["responses"],
-                        len(agg["sessions"]),
+                        agg["sessions"],
                         agg["total_tokens"],
                         agg["input_tokens"],
                         agg["output_tokens"],
@@ -712,7 +722,15 @@ def load_historical_records(
     conn = duckdb.connect(str(db_path))
 
     try:
-        query = "SELECT * FROM usage_records WHERE 1=1"
+        # Explicit column list in unpacking order: skips id and the device
+        # columns, and avoids building a dict per row
+        query = """
+            SELECT timestamp, session_id, message_uuid, message_type,
+                   model, folder, git_branch, version,
+                   input_tokens, output_tokens,
+                   cache_creation_tokens, cache_read_tokens
+            FROM usage_records WHERE 1=1
+        """
         params = []
 
         if start_date:
@@ -725,35 +743,34 @@ def load_historical_records(
 
         query += " ORDER BY date, timestamp"
 
-        result = conn.execute(query, params)
-        columns = [desc[0] for desc in result.description]
-        rows = result.fetchall()
-
+        fromisoformat = datetime.fromisoformat
         records = []
-        for row in rows:
-            row_dict = dict(zip(columns, row))
-
+        append = records.append
+        for (
+            timestamp, session_id, message_uuid, message_type,
+            model, folder, git_branch, version,
+            input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens,
+        ) in conn.execute(query, params).fetchall():
             token_usage = None
-            if row_dict.get("input_tokens", 0) > 0 or row_dict.get("output_tokens", 0) > 0:
+            if input_tokens > 0 or output_tokens > 0:
                 token_usage = TokenUsage(
-                    input_tokens=row_dict["input_tokens"],
-                    output_tokens=row_dict["output_tokens"],
-                    cache_creation_tokens=row_dict["cache_creation_tokens"],
-                    cache_read_tokens=row_dict["cache_read_tokens"],
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    cache_creation_tokens=cache_creation_tokens,
+                    cache_read_tokens=cache_read_tokens,
                 )
 
-            record = UsageRecord(
-                timestamp=datetime.fromisoformat(row_dict["timestamp"]),
-                session_id=row_dict["session_id"],
-                message_uuid=row_dict["message_uuid"],
-                message_type=row_dict["message_type"],
-                model=row_dict["model"],
-                folder=row_dict["folder"],
-                git_branch=row_dict["git_branch"],
-                version=row_dict["version"],
+            append(UsageRecord(
+                timestamp=fromisoformat(timestamp),
+                session_id=session_id,
+                message_uuid=message_uuid,
+                message_type=message_type,
+                model=model,
+                folder=folder,
+                git_branch=git_branch,
+                version=version,
                 token_usage=token_usage,
-            )
-            records.append(record)
+            ))
 
         return records
     finally:
@@ -910,6 +927,104 @@ def get_database_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
         conn.close()
 
 
+# statx(2) flags/mask bits from <linux/fcntl.h> and <linux/stat.h>
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_MTIME = 0x40
+_STATX_SIZE = 0x200
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("_spare", ctypes.c_uint64 * 16),
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _statx_func() -> Callable[..., int] | None:
+    """
+    Resolve glibc's statx() once per process.
+
+    Returns None off Linux, on libcs without the symbol, or on kernels
+    older than 4.11 (the probe call fails with ENOSYS).
+    """
+    if sys.platform != "linux":
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.statx
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [
+        ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx),
+    ]
+    func.restype = ctypes.c_int
+    buf = _Statx()
+    if func(_AT_FDCWD, b".", _AT_STATX_DONT_SYNC, _STATX_MTIME | _STATX_SIZE, ctypes.byref(buf)) != 0:
+        return None
+    return func
+
+
+def _fast_stat(path_str: str) -> tuple[int, int]:
+    """
+    Return (mtime_ns, size) using statx with AT_STATX_DONT_SYNC on Linux.
+
+    Only the mtime and size fields are requested, and cached inode data is
+    accepted rather than forcing a sync on network filesystems. Falls back
+    to os.stat when statx is unavailable or does not fill both fields.
+
+    Raises:
+        OSError: If the file cannot be statted
+    """
+    func = _statx_func()
+    if func is not None:
+        buf = _Statx()
+        rc = func(
+            _AT_FDCWD, os.fsencode(path_str), _AT_STATX_DONT_SYNC,
+            _STATX_MTIME | _STATX_SIZE, ctypes.byref(buf),
+        )
+        if rc != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path_str)
+        if buf.stx_mask & (_STATX_MTIME | _STATX_SIZE) == (_STATX_MTIME | _STATX_SIZE):
+            mtime = buf.stx_mtime
+            return mtime.tv_sec * 1_000_000_000 + mtime.tv_nsec, buf.stx_size
+    st = os.stat(path_str)
+    return st.st_mtime_ns, st.st_size
+
+
+def _safe_stat(file_path: "Path | str") -> tuple[int, int] | None:
+    """(mtime_ns, size) for file_path, or None if it cannot be statted."""
+    try:
+        return _fast_stat(os.fspath(file_path))
+    except OSError:
+        return None
+
+
 def get_stale_files(
     all_files: list[Path],
     db_path: Path = DEFAULT_DB_PATH
@@ -917,6 +1032,10 @@ def get_stale_files(
     """
     Identify which JSONL files need to be re-parsed.
 
+    The current (path, mtime_ns, size) set is staged as a relation and
+    reconciled against file_metadata with two anti-joins, so the comparison
+    runs inside DuckDB instead of a per-file Python dict lookup.
+
     Args:
         all_files: List of all JSONL file paths
         db_path: Path to the DuckDB database file
@@ -929,40 +1048,90 @@ def get_stale_files(
     if not db_path.exists():
         return (all_files, [])
 
-    init_database(db_path)
-
     conn = duckdb.connect(str(db_path))
-    stale_files = []
-    deleted_files = []
-
     try:
-        rows = conn.execute(
-            "SELECT file_path, mtime_ns, size_bytes FROM file_metadata"
-        ).fetchall()
-        stored_metadata = {row[0]: (row[1], row[2]) for row in rows}
-
-        current_file_paths = {str(f) for f in all_files}
-
-        for file_path in all_files:
-            path_str = str(file_path)
-            try:
-                stat = file_path.stat()
-                current_mtime_ns = stat.st_mtime_ns
-                current_size = stat.st_size
-
-                if path_str not in stored_metadata:
-                    stale_files.append(file_path)
-                else:
-                    stored_mtime_ns, stored_size = stored_metadata[path_str]
-                    if current_mtime_ns != stored_mtime_ns or current_size != stored_size:
-                        stale_files.append(file_path)
-            except OSError:
+        init_database(db_path, conn=conn)
+
+        # Nothing tracked yet (first run): every file is stale, so skip the
+        # stat pass entirely. No files listed: every tracked path is deleted.
+        if not all_files:
+            rows = conn.execute("SELECT file_path FROM file_metadata").fetchall()
+            return ([], [row[0] for row in rows])
+        if conn.execute("SELECT NOT EXISTS (SELECT 1 FROM file_metadata)").fetchone()[0]:
+            return (list(all_files), [])
+
+        # Stat up front; files that vanish between listing and stat are
+        # neither stale nor deleted this run (same as before), but still count
+        # as present. The stat syscalls release the GIL, so large scans
+        # overlap them across a thread pool.
+        if len(all_files) >= _PARALLEL_STAT_MIN_FILES:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                file_stats = list(pool.map(_safe_stat, all_files))
+        else:
+            file_stats = [_safe_stat(f) for f in all_files]
+
+        cols: dict[str, list] = {"idx": [], "file_path": [], "mtime_ns": [], "size_bytes": []}
+        present_paths = []
+        for idx, (file_path, file_stat) in enumerate(zip(all_files, file_stats, strict=True)):
+            path_str = os.fspath(file_path)
+            present_paths.append(path_str)
+            if file_stat is None:
                 continue
+            mtime_ns, size_bytes = file_stat
+            cols["idx"].append(idx)
+            cols["file_path"].append(path_str)
+            cols["mtime_ns"].append(mtime_ns)
+            cols["size_bytes"].append(size_bytes)
 
-        for stored_path in stored_metadata.keys():
-            if stored_path not in current_file_paths:
-                deleted_files.append(stored_path)
+        try:
+            import pyarrow as pa
+            use_arrow = True
+        except ImportError:
+            use_arrow = False
 
+        conn.execute("""
+            CREATE OR REPLACE TEMP TABLE current_files (
+                idx INTEGER, file_path VARCHAR, mtime_ns BIGINT, size_bytes BIGINT
+            )
+        """)
+        conn.execute("CREATE OR REPLACE TEMP TABLE listed_files (file_path VARCHAR)")
+        if use_arrow:
+            conn.register("current_arrow", pa.table(cols))
+            conn.register("listed_arrow", pa.table({"file_path": present_paths}))
+            conn.execute("INSERT INTO current_files SELECT * FROM current_arrow")
+            conn.execute("INSERT INTO listed_files SELECT * FROM listed_arrow")
+            conn.unregister("current_arrow")
+            conn.unregister("listed_arrow")
+        else:
+            if cols["idx"]:
+                conn.executemany(
+                    "INSERT INTO current_files VALUES (?, ?, ?, ?)",
+                    list(zip(*cols.values(), strict=True)),
+                )
+            if present_paths:
+                conn.executemany(
+                    "INSERT INTO listed_files VALUES (?)",
+                    [(p,) for p in present_paths],
+                )
+
+        stale_rows = conn.execute("""
+            SELECT c.idx
+            FROM current_files c
+            LEFT JOIN file_metadata m ON m.file_path = c.file_path
+            WHERE m.file_path IS NULL
+               OR m.mtime_ns <> c.mtime_ns
+               OR m.size_bytes <> c.size_bytes
+            ORDER BY c.idx
+        """).fetchall()
+        deleted_rows = conn.execute("""
+            SELECT m.file_path
+            FROM file_metadata m
+            ANTI JOIN listed_files l ON l.file_path = m.file_path
+        """).fetchall()
+
+        stale_files = [all_files[row[0]] for row in stale_rows]
+        deleted_files = [row[0] for row in deleted_rows]
         return (stale_files, deleted_files)
     finally:
         conn.close()
@@ -986,8 +1155,6 @@ def update_files_metadata(
     if not file_paths:
         return
 
-    init_database(db_path)
-
     timestamp = datetime.now().isoformat()
     rows = []
     for file_path in file_paths:
@@ -1005,13 +1172,43 @@ def update_files_metadata(
     if not rows:
         return
 
+    try:
+        import pyarrow as pa
+        use_arrow = True
+    except ImportError:
+        use_arrow = False
+
+    # executemany pays a full upsert round-trip per row (seconds for a few
+    # thousand files); a registered Arrow relation upserts the whole batch
+    # in one statement. Either way the batch commits as one transaction.
+    db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = duckdb.connect(str(db_path))
     try:
-        conn.executemany("""
-            INSERT OR REPLACE INTO file_metadata (
-                file_path, mtime_ns, size_bytes, record_count, last_parsed
-            ) VALUES (?, ?, ?, ?, ?)
-        """, rows)
+        init_database(db_path, conn=conn)
+        conn.begin()
+        if use_arrow:
+            names = ["file_path", "mtime_ns", "size_bytes", "record_count", "last_parsed"]
+            types = [pa.string(), pa.int64(), pa.int64(), pa.int32(), pa.string()]
+            columns = list(zip(*rows, strict=True))
+            conn.register("metadata_arrow", pa.table(
+                [pa.array(col, type=t) for col, t in zip(columns, types, strict=True)], names=names,
+            ))
+            conn.execute("""
+                INSERT OR REPLACE INTO file_metadata (
+                    file_path, mtime_ns, size_bytes, record_count, last_parsed
+                ) SELECT * FROM metadata_arrow
+            """)
+            conn.unregister("metadata_arrow")
+        else:
+            conn.executemany("""
+                INSERT OR REPLACE INTO file_metadata (
+                    file_path, mtime_ns, size_bytes, record_count, last_parsed
+                ) VALUES (?, ?, ?, ?, ?)
+            """, rows)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
     finally:
         conn.close()
 
@@ -1028,13 +1225,41 @@ def remove_deleted_file_metadata(
     if not deleted_paths or not db_path.exists():
         return
 
+    try:
+        import pyarrow as pa
+        use_arrow = True
+    except ImportError:
+        use_arrow = False
+
     conn = duckdb.connect(str(db_path))
 
     try:
-        conn.executemany(
-            "DELETE FROM file_metadata WHERE file_path = ?",
-            [(path,) for path in deleted_paths],
-        )
+        # One DELETE plan for the whole batch: inline placeholders for small
+        # batches, a registered Arrow relation otherwise. The chunked loop
+        # runs in one transaction so a failure leaves nothing half-deleted.
+        conn.begin()
+        if len(deleted_paths) < _ARROW_DELETE_MIN_PATHS or not use_arrow:
+            for i in range(0, len(deleted_paths), PATH_PARAM_CHUNK):
+                batch = deleted_paths[i:i + PATH_PARAM_CHUNK]
+                placeholders = ", ".join("?" * len(batch))
+                conn.execute(
+                    f"DELETE FROM file_metadata WHERE file_path IN ({placeholders})",
+                    batch,
+                )
+        else:
+            conn.register(
+                "deleted_arrow",
+                pa.table({"file_path": pa.array(deleted_paths, type=pa.string())}),
+            )
+            conn.execute(
+                "DELETE FROM file_metadata "
+                "WHERE file_path IN (SELECT file_path FROM deleted_arrow)"
+            )
+            conn.unregister("deleted_arrow")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
     finally:
         conn.close()
 
@@ -1214,39 +1439,36 @@ def fill_empty_daily_snapshots(
         start_date: Inclusive start date (YYYY-MM-DD)
         end_date: Inclusive end date (YYYY-MM-DD)
         db_path: Path to the DuckDB database file
+
+    Raises:
+        ValueError: If either bound is not a YYYY-MM-DD date
     """
+    # Same contract as the SQLite backend: reject malformed bounds with
+    # ValueError rather than DuckDB's ConversionException
+    start_date = date.fromisoformat(start_date).isoformat()
+    end_date = date.fromisoformat(end_date).isoformat()
+
     require_duckdb()
     init_database(db_path)
 
-    from datetime import datetime as _dt
-    from datetime import timedelta as _td
-
     conn = duckdb.connect(str(db_path))
     try:
-        existing = {
-            row[0]
-            for row in conn.execute("SELECT date FROM daily_snapshots").fetchall()
-        }
-        current = _dt.strptime(start_date, "%Y-%m-%d").date()
-        last = _dt.strptime(end_date, "%Y-%m-%d").date()
-        timestamp = _dt.now().isoformat()
-        inserted = 0
-        while current <= last:
-            date_str = current.strftime("%Y-%m-%d")
-            if date_str not in existing:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO daily_snapshots (
-                        date, total_prompts, total_responses, total_sessions, total_tokens,
-                        input_tokens, output_tokens, cache_creation_tokens,
-                        cache_read_tokens, snapshot_timestamp
-                    ) VALUES (?, 0, 0, 0, 0, 0, 0, 0, 0, ?)
-                    """,
-                    [date_str, timestamp],
-                )
-                inserted += 1
-            current += _td(days=1)
-        return inserted
+        # Generate the calendar with range() and anti-join it against the
+        # existing rows, instead of pulling every stored date into Python
+        # and walking the range with strftime per day
+        return conn.execute(
+            """
+            INSERT OR IGNORE INTO daily_snapshots (
+                date, total_prompts, total_responses, total_sessions, total_tokens,
+                input_tokens, output_tokens, cache_creation_tokens,
+                cache_read_tokens, snapshot_timestamp
+            )
+            SELECT strftime(d, '%Y-%m-%d'), 0, 0, 0, 0, 0, 0, 0, 0, ?
+            FROM range(CAST(? AS DATE), CAST(? AS DATE) + INTERVAL 1 DAY, INTERVAL 1 DAY) AS days(d)
+            WHERE strftime(d, '%Y-%m-%d') NOT IN (SELECT date FROM daily_snapshots)
+            """,
+            [datetime.now().isoformat(), start_date, end_date],
+        ).fetchone()[0]
     finally:
         conn.close()
 
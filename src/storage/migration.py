@@ -9,9 +9,12 @@ Handles:
 #region Imports
 import logging
 import sqlite3
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
+
+from src.storage.snapshot_db import _table_columns
 
 try:
     import duckdb
@@ -30,6 +33,9 @@ TABLES_WITH_DEVICE_COLUMNS = [
     "limits_snapshots",
 ]
 
+# Rows per batch when streaming a DuckDB table into SQLite
+_MIGRATION_BATCH_ROWS = 8192
+
 logger = logging.getLogger(__name__)
 #endregion
 
@@ -109,22 +115,14 @@ def migrate_sqlite_add_device_columns(
 
     with sqlite_connection(db_path) as conn:
         cursor = conn.cursor()
+        schema = _table_columns(cursor, TABLES_WITH_DEVICE_COLUMNS)
 
         for table in TABLES_WITH_DEVICE_COLUMNS:
-            # Check if table exists
-            cursor.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name=?
-            """, (table,))
-
-            if not cursor.fetchone():
+            existing_columns = schema.get(table)
+            if existing_columns is None:
                 logger.debug(f"Table {table} does not exist, skipping")
                 continue
 
-            # Get existing columns
-            cursor.execute(f"PRAGMA table_info({table})")
-            existing_columns = [row[1] for row in cursor.fetchall()]
-
             # Add missing device columns
             for col in DEVICE_COLUMNS:
                 if col not in existing_columns:
@@ -159,28 +157,14 @@ def check_sqlite_has_device_columns(db_path: Path) -> bool:
         return False
 
     with sqlite_connection(db_path) as conn:
-        cursor = conn.cursor()
-
-        for table in TABLES_WITH_DEVICE_COLUMNS:
-            # Check if table exists
-            cursor.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name=?
-            """, (table,))
+        schema = _table_columns(conn.cursor(), TABLES_WITH_DEVICE_COLUMNS)
 
-            if not cursor.fetchone():
-                continue
-
-            # Get existing columns
-            cursor.execute(f"PRAGMA table_info({table})")
-            existing_columns = {row[1] for row in cursor.fetchall()}
-
-            # Check if all device columns exist
-            for col in DEVICE_COLUMNS:
-                if col not in existing_columns:
-                    return False
-
-        return True
+    # Tables that don't exist yet don't count against the check
+    return all(
+        col in existing_columns
+        for existing_columns in schema.values()
+        for col in DEVICE_COLUMNS
+    )
 
 
 #endregion
@@ -219,43 +203,33 @@ def migrate_duckdb_add_device_columns(
     updated_count = 0
 
     with duckdb_connection(db_path) as conn:
-        for table in TABLES_WITH_DEVICE_COLUMNS:
-            # Check if table exists
-            result = conn.execute("""
-                SELECT table_name FROM information_schema.tables
-                WHERE table_name = ?
-            """, [table]).fetchone()
+        # One catalog query for every table's columns
+        schema: dict[str, set[str]] = {}
+        for table, column in conn.execute("""
+            SELECT table_name, column_name FROM information_schema.columns
+            WHERE table_name IN (SELECT unnest(?))
+        """, [TABLES_WITH_DEVICE_COLUMNS]).fetchall():
+            schema.setdefault(table, set()).add(column)
 
-            if not result:
+        for table in TABLES_WITH_DEVICE_COLUMNS:
+            existing_columns = schema.get(table)
+            if existing_columns is None:
                 logger.debug(f"Table {table} does not exist, skipping")
                 continue
 
-            # Get existing columns
-            columns_result = conn.execute("""
-                SELECT column_name FROM information_schema.columns
-                WHERE table_name = ?
-            """, [table]).fetchall()
-            existing_columns = {row[0] for row in columns_result}
-
             # Add missing device columns
             for col in DEVICE_COLUMNS:
                 if col not in existing_columns:
                     logger.info(f"Adding column {col} to table {table}")
                     conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} VARCHAR")
 
-            # Backfill existing records
-            conn.execute(f"""
+            # Backfill existing records; DuckDB returns the affected row
+            # count as the statement's result, matching SQLite's rowcount
+            updated_count += conn.execute(f"""
                 UPDATE {table}
                 SET device_id = ?, device_name = ?, device_type = ?
                 WHERE device_id IS NULL
-            """, [device_id, device_name, device_type])
-
-            # DuckDB doesn't have rowcount, count manually
-            count = conn.execute(f"""
-                SELECT COUNT(*) FROM {table}
-                WHERE device_id = ?
-            """, [device_id]).fetchone()[0]
-            updated_count += count
+            """, [device_id, device_name, device_type]).fetchone()[0]
 
     return updated_count
 
@@ -271,6 +245,237 @@ class MigrationError(Exception):
     pass
 
 
+# Columns copied per table (device columns are handled separately), in the
+# order the destination INSERT lists them
+_MIGRATED_COLUMNS = {
+    "daily_snapshots": [
+        "date", "total_prompts", "total_responses", "total_sessions",
+        "total_tokens", "input_tokens", "output_tokens",
+        "cache_creation_tokens", "cache_read_tokens", "snapshot_timestamp",
+    ],
+    "usage_records": [
+        "date", "timestamp", "session_id", "message_uuid", "message_type",
+        "model", "folder", "git_branch", "version",
+        "input_tokens", "output_tokens",
+        "cache_creation_tokens", "cache_read_tokens", "total_tokens",
+    ],
+    "limits_snapshots": [
+        "timestamp", "date", "session_pct", "week_pct", "opus_pct",
+        "session_reset", "week_reset", "opus_reset",
+    ],
+    "file_metadata": [
+        "file_path", "mtime_ns", "size_bytes", "record_count", "last_parsed",
+    ],
+}
+
+
+def _attach_sqlite(
+    duckdb_conn: "duckdb.DuckDBPyConnection",
+    sqlite_path: Path,
+    alias: str = "src",
+    read_only: bool = True,
+) -> bool:
+    """
+    Attach a SQLite file to a DuckDB connection via DuckDB's sqlite extension.
+
+    Args:
+        duckdb_conn: Open DuckDB connection
+        sqlite_path: Path to the SQLite database file
+        alias: Catalog name to attach as
+        read_only: Attach read-only (migration source) or writable (target)
+
+    Returns:
+        True if attached; False if the extension is not already installed
+        (it is never downloaded here) or the ATTACH fails
+    """
+    try:
+        duckdb_conn.execute("LOAD sqlite")
+        quoted = str(sqlite_path).replace("'", "''")
+        options = "TYPE sqlite, READ_ONLY" if read_only else "TYPE sqlite"
+        duckdb_conn.execute(f"ATTACH '{quoted}' AS {alias} ({options})")
+    except duckdb.Error as e:
+        logger.debug(f"sqlite extension unavailable, using row copy: {e}")
+        return False
+    return True
+
+
+def _copy_attached_sqlite(
+    duckdb_conn: "duckdb.DuckDBPyConnection",
+    sqlite_conn: sqlite3.Connection,
+    stats: dict[str, Any],
+    device_values: list[str | None],
+) -> None:
+    """
+    Copy every migrated table from the attached `src` schema in one
+    INSERT ... SELECT per table, mirroring the row-by-row path's semantics.
+    A table whose INSERT ... SELECT fails is copied through the staged row
+    path instead.
+
+    Args:
+        duckdb_conn: DuckDB connection with the SQLite source attached as `src`
+        sqlite_conn: Connection to the same SQLite file, used for schema checks
+        stats: Migration stats dict, updated in place
+        device_values: [device_id, device_name, device_type] fallbacks
+    """
+    for table, columns in _MIGRATED_COLUMNS.items():
+        source_columns = {
+            row[1] for row in sqlite_conn.execute(f"PRAGMA table_info({table})")
+        }
+        if not source_columns:
+            continue
+
+        select_list = [f"s.{col}" for col in columns]
+        insert_list = list(columns)
+        params: list[str | None] = []
+        if table != "file_metadata":
+            # Same fallback as `row.get(col) or default`: NULL and '' both
+            # take the supplied device value
+            for col, value in zip(DEVICE_COLUMNS, device_values, strict=True):
+                insert_list.append(col)
+                select_list.append(
+                    f"COALESCE(NULLIF(s.{col}, ''), ?)" if col in source_columns else "?"
+                )
+                params.append(value)
+
+        if table == "usage_records":
+            sql = f"""
+                INSERT INTO usage_records ({", ".join(insert_list)})
+                SELECT {", ".join(select_list)}
+                FROM src.usage_records s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM usage_records u
+                    WHERE u.session_id = s.session_id AND u.message_uuid = s.message_uuid
+                )
+            """
+        else:
+            sql = f"""
+                INSERT OR REPLACE INTO {table} ({", ".join(insert_list)})
+                SELECT {", ".join(select_list)} FROM src.{table} s
+            """
+
+        try:
+            stats[table] += duckdb_conn.execute(sql, params).fetchone()[0]
+        except duckdb.Error as e:
+            # The failed statement wrote nothing; redo the table through the
+            # staged row copy, as the DuckDB -> SQLite direction does
+            logger.debug(f"Attached copy of {table} failed, using row copy: {e}")
+            try:
+                stats[table] += _copy_sqlite_table_staged(
+                    duckdb_conn, sqlite_conn, table, columns, device_values
+                )
+            except (sqlite3.Error, duckdb.Error) as e:
+                logger.warning(f"Error migrating {table}: {e}")
+                stats["errors"].append(f"{table}: {e}")
+
+
+def _insert_staged(duckdb_conn: "duckdb.DuckDBPyConnection", table: str, staged: dict[str, list[Any]]) -> int:
+    """
+    Write staged rows into a DuckDB table in one INSERT ... SELECT.
+
+    usage_records rows whose (session_id, message_uuid) is already present
+    are skipped; the other tables are upserted.
+
+    Args:
+        duckdb_conn: Open DuckDB connection
+        table: Destination table
+        staged: Column name -> values (device fallbacks already applied)
+
+    Returns:
+        Number of rows written
+    """
+    names = list(staged)
+    column_list = ", ".join(names)
+    staging = f"{table}_staging"
+
+    # Arrow hands the columns over without per-row binding; it can't type a
+    # column SQLite stored with mixed types, so those (and installs without
+    # pyarrow) bind through one prepared executemany into a temp table
+    arrow_table = None
+    try:
+        import pyarrow as pa
+        try:
+            arrow_table = pa.table(staged)
+        except pa.ArrowException:
+            pass
+    except ImportError:
+        pass
+
+    if arrow_table is not None:
+        duckdb_conn.register(staging, arrow_table)
+    else:
+        duckdb_conn.execute(
+            f"CREATE OR REPLACE TEMP TABLE {staging} AS "
+            f"SELECT {column_list} FROM {table} WHERE false"
+        )
+        duckdb_conn.executemany(
+            f"INSERT INTO {staging} VALUES ({', '.join('?' * len(names))})",
+            list(zip(*staged.values(), strict=True)),
+        )
+
+    try:
+        if table == "usage_records":
+            sql = f"""
+                INSERT INTO usage_records ({column_list})
+                SELECT {column_list}
+                FROM {staging} s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM usage_records u
+                    WHERE u.session_id = s.session_id AND u.message_uuid = s.message_uuid
+                )
+            """
+        else:
+            sql = f"INSERT OR REPLACE INTO {table} ({column_list}) SELECT {column_list} FROM {staging}"
+        return duckdb_conn.execute(sql).fetchone()[0]
+    finally:
+        if arrow_table is not None:
+            duckdb_conn.unregister(staging)
+        else:
+            duckdb_conn.execute(f"DROP TABLE IF EXISTS {staging}")
+
+
+def _copy_sqlite_table_staged(
+    duckdb_conn: "duckdb.DuckDBPyConnection",
+    sqlite_conn: sqlite3.Connection,
+    table: str,
+    columns: list[str],
+    device_values: list[str | None],
+) -> int:
+    """
+    Read one SQLite table and hand it to DuckDB as a single staged batch
+    rather than one parsed INSERT per row.
+
+    Args:
+        duckdb_conn: Destination DuckDB connection
+        sqlite_conn: Source SQLite connection with sqlite3.Row rows
+        table: Table to copy
+        columns: Non-device columns to copy
+        device_values: [device_id, device_name, device_type] fallbacks for
+            rows whose device columns are NULL or empty
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        sqlite3.OperationalError: If the source table does not exist
+    """
+    rows = sqlite_conn.execute(f"SELECT * FROM {table}").fetchall()
+    with_device = table != "file_metadata"
+    staged: dict[str, list[Any]] = {
+        col: [] for col in columns + (DEVICE_COLUMNS if with_device else [])
+    }
+    for row in rows:
+        row_dict = dict(row)
+        for col in columns:
+            staged[col].append(row_dict[col])
+        if with_device:
+            for col, default in zip(DEVICE_COLUMNS, device_values, strict=True):
+                staged[col].append(row_dict.get(col) or default)
+
+    if not staged[columns[0]]:
+        return 0
+    return _insert_staged(duckdb_conn, table, staged)
+
+
 def migrate_sqlite_to_duckdb(
     sqlite_path: Path,
     duckdb_path: Path,
@@ -320,143 +525,30 @@ def migrate_sqlite_to_duckdb(
     duckdb_conn = duckdb.connect(str(duckdb_path))
 
     try:
-        sqlite_cursor = sqlite_conn.cursor()
-
-        # Migrate daily_snapshots
-        try:
-            sqlite_cursor.execute("SELECT * FROM daily_snapshots")
-            for row in sqlite_cursor.fetchall():
-                row_dict = dict(row)
-                duckdb_conn.execute("""
-                    INSERT OR REPLACE INTO daily_snapshots (
-                        date, total_prompts, total_responses, total_sessions,
-                        total_tokens, input_tokens, output_tokens,
-                        cache_creation_tokens, cache_read_tokens, snapshot_timestamp,
-                        device_id, device_name, device_type
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, [
-                    row_dict["date"],
-                    row_dict["total_prompts"],
-                    row_dict["total_responses"],
-                    row_dict["total_sessions"],
-                    row_dict["total_tokens"],
-                    row_dict["input_tokens"],
-                    row_dict["output_tokens"],
-                    row_dict["cache_creation_tokens"],
-                    row_dict["cache_read_tokens"],
-                    row_dict["snapshot_timestamp"],
-                    row_dict.get("device_id") or device_id,
-                    row_dict.get("device_name") or device_name,
-                    row_dict.get("device_type") or device_type,
-                ])
-                stats["daily_snapshots"] += 1
-        except sqlite3.OperationalError as e:
-            if "no such table" not in str(e).lower():
-                logger.warning(f"Error migrating daily_snapshots: {e}")
-                stats["errors"].append(f"daily_snapshots: {e}")
-
-        # Migrate usage_records
-        try:
-            sqlite_cursor.execute("SELECT * FROM usage_records")
-            for row in sqlite_cursor.fetchall():
-                row_dict = dict(row)
-
-                # Check if record already exists
-                existing = duckdb_conn.execute("""
-                    SELECT 1 FROM usage_records
-                    WHERE session_id = ? AND message_uuid = ?
-                """, [row_dict["session_id"], row_dict["message_uuid"]]).fetchone()
-
-                if not existing:
-                    next_id = duckdb_conn.execute(
-                        "SELECT nextval('usage_records_id_seq')"
-                    ).fetchone()[0]
-
-                    duckdb_conn.execute("""
-                        INSERT INTO usage_records (
-                            id, date, timestamp, session_id, message_uuid, message_type,
-                            model, folder, git_branch, version,
-                            input_tokens, output_tokens,
-                            cache_creation_tokens, cache_read_tokens, total_tokens,
-                            device_id, device_name, device_type
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, [
-                        next_id,
-                        row_dict["date"],
-                        row_dict["timestamp"],
-                        row_dict["session_id"],
-                        row_dict["message_uuid"],
-                        row_dict["message_type"],
-                        row_dict["model"],
-                        row_dict["folder"],
-                        row_dict["git_branch"],
-                        row_dict["version"],
-                        row_dict["input_tokens"],
-                        row_dict["output_tokens"],
-                        row_dict["cache_creation_tokens"],
-                        row_dict["cache_read_tokens"],
-                        row_dict["total_tokens"],
-                        row_dict.get("device_id") or device_id,
-                        row_dict.get("device_name") or device_name,
-                        row_dict.get("device_type") or device_type,
-                    ])
-                    stats["usage_records"] += 1
-        except sqlite3.OperationalError as e:
-            if "no such table" not in str(e).lower():
-                logger.warning(f"Error migrating usage_records: {e}")
-                stats["errors"].append(f"usage_records: {e}")
-
-        # Migrate limits_snapshots
-        try:
-            sqlite_cursor.execute("SELECT * FROM limits_snapshots")
-            for row in sqlite_cursor.fetchall():
-                row_dict = dict(row)
-                duckdb_conn.execute("""
-                    INSERT OR REPLACE INTO limits_snapshots (
-                        timestamp, date, session_pct, week_pct, opus_pct,
-                        session_reset, week_reset, opus_reset,
-                        device_id, device_name, device_type
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, [
-                    row_dict["timestamp"],
-                    row_dict["date"],
-                    row_dict["session_pct"],
-                    row_dict["week_pct"],
-                    row_dict["opus_pct"],
-                    row_dict["session_reset"],
-                    row_dict["week_reset"],
-                    row_dict["opus_reset"],
-                    row_dict.get("device_id") or device_id,
-                    row_dict.get("device_name") or device_name,
-                    row_dict.get("device_type") or device_type,
-                ])
-                stats["limits_snapshots"] += 1
-        except sqlite3.OperationalError as e:
-            if "no such table" not in str(e).lower():
-                logger.warning(f"Error migrating limits_snapshots: {e}")
-                stats["errors"].append(f"limits_snapshots: {e}")
-
-        # Migrate file_metadata
-        try:
-            sqlite_cursor.execute("SELECT * FROM file_metadata")
-            for row in sqlite_cursor.fetchall():
-                row_dict = dict(row)
-                duckdb_conn.execute("""
-                    INSERT OR REPLACE INTO file_metadata (
-                        file_path, mtime_ns, size_bytes, record_count, last_parsed
-                    ) VALUES (?, ?, ?, ?, ?)
-                """, [
-                    row_dict["file_path"],
-                    row_dict["mtime_ns"],
-                    row_dict["size_bytes"],
-                    row_dict["record_count"],
-                    row_dict["last_parsed"],
-                ])
-                stats["file_metadata"] += 1
-        except sqlite3.OperationalError as e:
-            if "no such table" not in str(e).lower():
-                logger.warning(f"Error migrating file_metadata: {e}")
-                stats["errors"].append(f"file_metadata: {e}")
+        # Fast path: let DuckDB read the SQLite file directly and move each
+        # table in a single columnar INSERT ... SELECT
+        if _attach_sqlite(duckdb_conn, sqlite_path):
+            try:
+                _copy_attached_sqlite(
+                    duckdb_conn, sqlite_conn, stats, [device_id, device_name, device_type]
+                )
+            finally:
+                duckdb_conn.execute("DETACH src")
+            logger.info(f"Migration complete: {stats}")
+            return stats
+
+        # Row copy: read each SQLite table once and hand it to DuckDB as a
+        # single staged batch
+        for table, columns in _MIGRATED_COLUMNS.items():
+            try:
+                stats[table] += _copy_sqlite_table_staged(
+                    duckdb_conn, sqlite_conn, table, columns,
+                    [device_id, device_name, device_type],
+                )
+            except sqlite3.OperationalError as e:
+                if "no such table" not in str(e).lower():
+                    logger.warning(f"Error migrating {table}: {e}")
+                    stats["errors"].append(f"{table}: {e}")
 
         logger.info(f"Migration complete: {stats}")
 
@@ -473,6 +565,153 @@ def migrate_sqlite_to_duckdb(
 #region DuckDB to SQLite Migration
 
 
+# Primary key of each upserted SQLite table; the sqlite extension has no
+# ON CONFLICT support, so upserts into an attached file are DELETE + INSERT
+_SQLITE_UPSERT_KEYS = {
+    "daily_snapshots": "date",
+    "limits_snapshots": "timestamp",
+    "file_metadata": "file_path",
+}
+
+
+def _copy_to_attached_sqlite(
+    duckdb_conn: "duckdb.DuckDBPyConnection",
+    stats: dict[str, Any],
+    device_values: list[str | None],
+) -> None:
+    """
+    Copy every migrated table into the SQLite file attached as `tgt`, one
+    set-based statement pair per table, in a single transaction.
+
+    Mirrors the row-copy semantics: device fallbacks apply when a column is
+    NULL or empty, usage_records skips (session_id, message_uuid) pairs the
+    target already has, other tables are upserted.
+
+    Args:
+        duckdb_conn: DuckDB connection with the SQLite target attached as `tgt`
+        stats: Migration stats dict, updated only if the whole copy commits
+        device_values: [device_id, device_name, device_type] fallbacks
+
+    Raises:
+        duckdb.Error: If any statement fails; nothing is written in that case
+    """
+    source_tables = {
+        row[0] for row in duckdb_conn.execute(
+            "SELECT table_name FROM duckdb_tables() WHERE database_name = current_database()"
+        ).fetchall()
+    }
+    counts: dict[str, int] = {}
+
+    duckdb_conn.execute("BEGIN")
+    try:
+        for table, columns in _MIGRATED_COLUMNS.items():
+            if table not in source_tables:
+                continue
+
+            insert_list = list(columns)
+            select_list = [f"s.{col}" for col in columns]
+            params: list[str | None] = []
+            if table != "file_metadata":
+                for col, value in zip(DEVICE_COLUMNS, device_values, strict=True):
+                    insert_list.append(col)
+                    select_list.append(f"COALESCE(NULLIF(s.{col}, ''), ?)")
+                    params.append(value)
+
+            if table == "usage_records":
+                counts[table] = duckdb_conn.execute(f"""
+                    INSERT INTO tgt.usage_records ({", ".join(insert_list)})
+                    SELECT {", ".join(select_list)}
+                    FROM usage_records s
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM tgt.usage_records u
+                        WHERE u.session_id = s.session_id AND u.message_uuid = s.message_uuid
+                    )
+                """, params).fetchone()[0]
+            else:
+                key = _SQLITE_UPSERT_KEYS[table]
+                duckdb_conn.execute(
+                    f"DELETE FROM tgt.{table} WHERE {key} IN (SELECT {key} FROM {table})"
+                )
+                counts[table] = duckdb_conn.execute(f"""
+                    INSERT INTO tgt.{table} ({", ".join(insert_list)})
+                    SELECT {", ".join(select_list)} FROM {table} s
+                """, params).fetchone()[0]
+        duckdb_conn.execute("COMMIT")
+    except duckdb.Error:
+        duckdb_conn.execute("ROLLBACK")
+        raise
+
+    for table, count in counts.items():
+        stats[table] += count
+
+
+def _copy_duckdb_table_to_sqlite(
+    duckdb_conn: "duckdb.DuckDBPyConnection",
+    sqlite_conn: sqlite3.Connection,
+    table: str,
+    columns: list[str],
+    device_values: list[str | None],
+) -> int:
+    """
+    Copy one DuckDB table into the same-named SQLite table with a single
+    executemany over the prepared INSERT.
+
+    usage_records uses INSERT OR IGNORE so rows already present (by
+    UNIQUE(session_id, message_uuid)) are skipped and not counted; the other
+    tables are upserted.
+
+    Args:
+        duckdb_conn: Source DuckDB connection
+        sqlite_conn: Destination SQLite connection (caller commits)
+        table: Table to copy
+        columns: Non-device columns to copy
+        device_values: [device_id, device_name, device_type] fallbacks for
+            rows whose device columns are NULL or empty
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        duckdb.CatalogException: If the source table does not exist
+    """
+    result = duckdb_conn.execute(f"SELECT * FROM {table}")
+    source_columns = [desc[0] for desc in result.description]
+    with_device = table != "file_metadata"
+    insert_columns = columns + (DEVICE_COLUMNS if with_device else [])
+
+    def source_rows() -> Iterator[tuple[Any, ...]]:
+        # Stream in batches so memory stays O(batch) instead of the whole
+        # table as Python tuples; Arrow keeps each batch columnar until here
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            while chunk := result.fetchmany(_MIGRATION_BATCH_ROWS):
+                yield from chunk
+            return
+        for batch in result.to_arrow_reader(_MIGRATION_BATCH_ROWS):
+            yield from zip(*(column.to_pylist() for column in batch.columns), strict=True)
+
+    def rows() -> Iterator[list[Any]]:
+        for row in source_rows():
+            row_dict = dict(zip(source_columns, row, strict=True))
+            values = [row_dict[col] for col in columns]
+            if with_device:
+                values.extend(
+                    row_dict.get(col) or default
+                    for col, default in zip(DEVICE_COLUMNS, device_values, strict=True)
+                )
+            yield values
+
+    verb = "INSERT OR IGNORE" if table == "usage_records" else "INSERT OR REPLACE"
+    changes_before = sqlite_conn.total_changes
+    sqlite_conn.executemany(
+        f"{verb} INTO {table} ({', '.join(insert_columns)}) "
+        f"VALUES ({', '.join('?' * len(insert_columns))})",
+        rows(),
+    )
+    return sqlite_conn.total_changes - changes_before
+
+
 def migrate_duckdb_to_sqlite(
     duckdb_path: Path,
     sqlite_path: Path,
@@ -525,144 +764,45 @@ def migrate_duckdb_to_sqlite(
     }
 
     duckdb_conn = duckdb.connect(str(duckdb_path))
+
+    # Fast path: attach the SQLite file to DuckDB and copy each table without
+    # the rows passing through Python. Any failure (extension missing, older
+    # source schema) rolls back and falls through to the row copy below.
+    if _attach_sqlite(duckdb_conn, sqlite_path, alias="tgt", read_only=False):
+        copied = False
+        try:
+            _copy_to_attached_sqlite(duckdb_conn, stats, [device_id, device_name, device_type])
+            copied = True
+        except duckdb.Error as e:
+            logger.debug(f"Attached copy failed, using row copy: {e}")
+        finally:
+            duckdb_conn.execute("DETACH tgt")
+        if copied:
+            duckdb_conn.close()
+            logger.info(f"Migration complete: {stats}")
+            return stats
+
     sqlite_conn = sqlite3.connect(sqlite_path)
 
     try:
-        sqlite_cursor = sqlite_conn.cursor()
-
-        # Migrate daily_snapshots
-        try:
-            rows = duckdb_conn.execute("SELECT * FROM daily_snapshots").fetchall()
-            columns = [desc[0] for desc in duckdb_conn.description]
-
-            for row in rows:
-                row_dict = dict(zip(columns, row))
-                sqlite_cursor.execute("""
-                    INSERT OR REPLACE INTO daily_snapshots (
-                        date, total_prompts, total_responses, total_sessions,
-                        total_tokens, input_tokens, output_tokens,
-                        cache_creation_tokens, cache_read_tokens, snapshot_timestamp,
-                        device_id, device_name, device_type
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    row_dict["date"],
-                    row_dict["total_prompts"],
-                    row_dict["total_responses"],
-                    row_dict["total_sessions"],
-                    row_dict["total_tokens"],
-                    row_dict["input_tokens"],
-                    row_dict["output_tokens"],
-                    row_dict["cache_creation_tokens"],
-                    row_dict["cache_read_tokens"],
-                    row_dict["snapshot_timestamp"],
-                    row_dict.get("device_id") or device_id,
-                    row_dict.get("device_name") or device_name,
-                    row_dict.get("device_type") or device_type,
-                ))
-                stats["daily_snapshots"] += 1
-        except duckdb.CatalogException as e:
-            if "not exist" not in str(e).lower():
-                logger.warning(f"Error migrating daily_snapshots: {e}")
-                stats["errors"].append(f"daily_snapshots: {e}")
-
-        # Migrate usage_records
-        try:
-            rows = duckdb_conn.execute("SELECT * FROM usage_records").fetchall()
-            columns = [desc[0] for desc in duckdb_conn.description]
-
-            for row in rows:
-                row_dict = dict(zip(columns, row))
-                try:
-                    sqlite_cursor.execute("""
-                        INSERT INTO usage_records (
-                            date, timestamp, session_id, message_uuid, message_type,
-                            model, folder, git_branch, version,
-                            input_tokens, output_tokens,
-                            cache_creation_tokens, cache_read_tokens, total_tokens,
-                            device_id, device_name, device_type
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        row_dict["date"],
-                        row_dict["timestamp"],
-                        row_dict["session_id"],
-                        row_dict["message_uuid"],
-                        row_dict["message_type"],
-                        row_dict["model"],
-                        row_dict["folder"],
-                        row_dict["git_branch"],
-                        row_dict["version"],
-                        row_dict["input_tokens"],
-                        row_dict["output_tokens"],
-                        row_dict["cache_creation_tokens"],
-                        row_dict["cache_read_tokens"],
-                        row_dict["total_tokens"],
-                        row_dict.get("device_id") or device_id,
-                        row_dict.get("device_name") or device_name,
-                        row_dict.get("device_type") or device_type,
-                    ))
-                    stats["usage_records"] += 1
-                except sqlite3.IntegrityError:
-                    logger.debug("Skipping duplicate usage_record")
-        except duckdb.CatalogException as e:
-            if "not exist" not in str(e).lower():
-                logger.warning(f"Error migrating usage_records: {e}")
-                stats["errors"].append(f"usage_records: {e}")
-
-        # Migrate limits_snapshots
-        try:
-            rows = duckdb_conn.execute("SELECT * FROM limits_snapshots").fetchall()
-            columns = [desc[0] for desc in duckdb_conn.description]
-
-            for row in rows:
-                row_dict = dict(zip(columns, row))
-                sqlite_cursor.execute("""
-                    INSERT OR REPLACE INTO limits_snapshots (
-                        timestamp, date, session_pct, week_pct, opus_pct,
-                        session_reset, week_reset, opus_reset,
-                        device_id, device_name, device_type
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    row_dict["timestamp"],
-                    row_dict["date"],
-                    row_dict["session_pct"],
-                    row_dict["week_pct"],
-                    row_dict["opus_pct"],
-                    row_dict["session_reset"],
-                    row_dict["week_reset"],
-                    row_dict["opus_reset"],
-                    row_dict.get("device_id") or device_id,
-                    row_dict.get("device_name") or device_name,
-                    row_dict.get("device_type") or device_type,
-                ))
-                stats["limits_snapshots"] += 1
-        except duckdb.CatalogException as e:
-            if "not exist" not in str(e).lower():
-                logger.warning(f"Error migrating limits_snapshots: {e}")
-                stats["errors"].append(f"limits_snapshots: {e}")
-
-        # Migrate file_metadata
-        try:
-            rows = duckdb_conn.execute("SELECT * FROM file_metadata").fetchall()
-            columns = [desc[0] for desc in duckdb_conn.description]
-
-            for row in rows:
-                row_dict = dict(zip(columns, row))
-                sqlite_cursor.execute("""
-                    INSERT OR REPLACE INTO file_metadata (
-                        file_path, mtime_ns, size_bytes, record_count, last_parsed
-                    ) VALUES (?, ?, ?, ?, ?)
-                """, (
-                    row_dict["file_path"],
-                    row_dict["mtime_ns"],
-                    row_dict["size_bytes"],
-                    row_dict["record_count"],
-                    row_dict["last_parsed"],
-                ))
-                stats["file_metadata"] += 1
-        except duckdb.CatalogException as e:
-            if "not exist" not in str(e).lower():
-                logger.warning(f"Error migrating file_metadata: {e}")
-                stats["errors"].append(f"file_metadata: {e}")
+        # Bulk-load settings for this connection only. synchronous stays at
+        # its default: the target may be an existing database, and the
+        # single commit below is its only fsync. journal_mode is left alone:
+        # it persists in the file and WAL side files break copy-based sync.
+        sqlite_conn.execute("PRAGMA temp_store=MEMORY")
+        sqlite_conn.execute("PRAGMA cache_size=-200000")
+        sqlite_conn.execute("BEGIN")
+
+        for table, columns in _MIGRATED_COLUMNS.items():
+            try:
+                stats[table] += _copy_duckdb_table_to_sqlite(
+                    duckdb_conn, sqlite_conn, table, columns,
+                    [device_id, device_name, device_type],
+                )
+            except duckdb.CatalogException as e:
+                if "not exist" not in str(e).lower():
+                    logger.warning(f"Error migrating {table}: {e}")
+                    stats["errors"].append(f"{table}: {e}")
 
         sqlite_conn.commit()
         logger.info(f"Migration complete: {stats}")
@@ -707,33 +847,41 @@ def get_migration_status(sqlite_path: Path, duckdb_path: Path) -> dict:
     }
 
     if sqlite_path.exists():
-        status["sqlite"]["has_device_columns"] = check_sqlite_has_device_columns(sqlite_path)
+        # Device-column check and row count in a single round-trip
+        tables = ", ".join("?" * len(TABLES_WITH_DEVICE_COLUMNS))
+        device_cols = ", ".join("?" * len(DEVICE_COLUMNS))
         try:
             with sqlite_connection(sqlite_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM daily_snapshots")
-                status["sqlite"]["record_count"] = cursor.fetchone()[0]
+                present, with_device, count = conn.execute(f"""
+                    WITH cols AS (
+                        SELECT m.name AS table_name, p.name AS column_name
+                        FROM sqlite_master m JOIN pragma_table_info(m.name) p
+                        WHERE m.type = 'table' AND m.name IN ({tables})
+                    )
+                    SELECT
+                        (SELECT COUNT(DISTINCT table_name) FROM cols),
+                        (SELECT COUNT(*) FROM cols WHERE column_name IN ({device_cols})),
+                        (SELECT COUNT(*) FROM daily_snapshots)
+                """, TABLES_WITH_DEVICE_COLUMNS + DEVICE_COLUMNS).fetchone()
+            status["sqlite"]["has_device_columns"] = with_device == present * len(DEVICE_COLUMNS)
+            status["sqlite"]["record_count"] = count
         except sqlite3.Error as e:
+            status["sqlite"]["has_device_columns"] = check_sqlite_has_device_columns(sqlite_path)
             status["sqlite"]["error"] = str(e)
             logger.warning(f"Error checking SQLite status: {e}")
 
     if DUCKDB_AVAILABLE and duckdb_path.exists():
         try:
             with duckdb_connection(duckdb_path) as conn:
-                # Check for device columns
-                columns = conn.execute("""
-                    SELECT column_name FROM information_schema.columns
-                    WHERE table_name = 'daily_snapshots'
-                """).fetchall()
-                column_names = {row[0] for row in columns}
-                status["duckdb"]["has_device_columns"] = all(
-                    col in column_names for col in DEVICE_COLUMNS
-                )
-
-                # Get record count
-                status["duckdb"]["record_count"] = conn.execute(
-                    "SELECT COUNT(*) FROM daily_snapshots"
-                ).fetchone()[0]
+                device_count, record_count = conn.execute("""
+                    SELECT
+                        (SELECT COUNT(*) FROM information_schema.columns
+                         WHERE table_name = 'daily_snapshots'
+                           AND column_name IN (SELECT unnest(?))),
+                        (SELECT COUNT(*) FROM daily_snapshots)
+                """, [DEVICE_COLUMNS]).fetchone()
+                status["duckdb"]["has_device_columns"] = device_count == len(DEVICE_COLUMNS)
+                status["duckdb"]["record_count"] = record_count
         except Exception as e:
             status["duckdb"]["error"] = str(e)
             logger.warning(f"Error checking DuckDB status: {e}")
@@ -9,6 +9,7 @@ ids, or message content. Auth reuses the machine's `az login` session
 (bearer token in memory only, never on disk).
 """
 #region Imports
+import functools
 import json
 import shutil
 import subprocess
@@ -17,18 +18,14 @@ import urllib.error
 import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
-
-try:
-    import pyarrow as pa
-    from deltalake import DeltaTable, write_deltalake
-    from deltalake.exceptions import CommitFailedError, DeltaError, TableNotFoundError
-    DELTALAKE_AVAILABLE = True
-except ImportError:
-    DELTALAKE_AVAILABLE = False
+from typing import TYPE_CHECKING, Any, Optional
 
 from src.config.user_config import get_device_accounts, get_sync_config
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from deltalake import DeltaTable
+
 #endregion
 
 
@@ -87,8 +84,25 @@ _LIMITS_SELECT = """
 #region Helpers
 
 
+@functools.lru_cache(maxsize=1)
+def _deltalake_available() -> bool:
+    """
+    Probe the optional onelake extra once per process.
+
+    deltalake and pyarrow are imported lazily by the push path only: this
+    module is pulled in by `ccg sync` registration (query.py reuses the
+    token helper), and importing them up front taxed every CLI start.
+    """
+    try:
+        import deltalake  # noqa: F401
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 def _require_deltalake() -> None:
-    if not DELTALAKE_AVAILABLE:
+    if not _deltalake_available():
         raise ImportError("deltalake not installed. Install with: uv pip install 'claude-goblin[onelake]'")
 
 
@@ -103,6 +117,20 @@ def _get_onelake_config() -> dict[str, Any]:
     return config
 
 
+@functools.lru_cache(maxsize=1)
+def _az_executable() -> str | None:
+    """
+    Resolve the az CLI once per process.
+
+    A push mints tokens for more than one resource (storage, then Power BI
+    for the reframe); each PATH walk costs a stat per entry. Call
+    _az_executable.cache_clear() to re-probe.
+    """
+    # Resolve the executable so Windows finds az.cmd (bare names skip
+    # PATHEXT resolution under CreateProcess).
+    return shutil.which("az")
+
+
 def _get_az_token(resource: str, tenant_id: str | None) -> str:
     """
     Mint a bearer token for `resource` off the current az login session.
@@ -110,9 +138,7 @@ def _get_az_token(resource: str, tenant_id: str | None) -> str:
     The token stays in memory; the tenant pin avoids minting against whatever
     tenant happens to be the ambient az default on multi-tenant machines.
     """
-    # Resolve the executable so Windows finds az.cmd (bare names skip
-    # PATHEXT resolution under CreateProcess).
-    az = shutil.which("az")
+    az = _az_executable()
     if az is None:
         raise RuntimeError("az CLI not found on PATH. Install Azure CLI and run: az login")
     args = [az, "account", "get-access-token", "--resource", resource,
@@ -200,6 +226,9 @@ def _upsert(
     Returns:
         Rows inserted (batch size on create, merge metrics otherwise)
     """
+    from deltalake import DeltaTable, write_deltalake
+    from deltalake.exceptions import CommitFailedError, DeltaError, TableNotFoundError
+
     try:
         table = DeltaTable(uri, storage_options=storage_options)
     except TableNotFoundError:
@@ -236,6 +265,7 @@ def _fetch_batches(
 ) -> dict[str, Any]:
     """Read the outgoing daily-aggregate/pricing/devices/limits Arrow batches."""
     import duckdb
+    import pyarrow as pa
 
     where, params = _device_where(device_filter)
     conn = duckdb.connect(str(local_db_path), read_only=True)
@@ -465,6 +495,8 @@ def push_to_onelake(
 
     compact_every = int(config.get("compact_every", _DEFAULT_COMPACT_EVERY))
     if compact_every > 0 and push_count % compact_every == 0:
+        from deltalake import DeltaTable
+
         handles: dict[str, DeltaTable | None] = {}
         for name in ("usage_daily", "devices"):
             try:
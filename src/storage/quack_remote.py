@@ -377,34 +377,48 @@ def _push_model_pricing(conn: "duckdb.DuckDBPyConnection") -> None:
         pass
 
 
-def _push_limits(conn: "duckdb.DuckDBPyConnection") -> bool:
+def _push_limits(conn: "duckdb.DuckDBPyConnection", wm_ts: str | None = None) -> bool:
     """
     Anti-join INSERT of new limits_snapshots rows by timestamp.
 
+    With a watermark, only local rows newer than it are candidates and only
+    remote timestamps past it are pulled for the dedupe, so the transfer is
+    O(new rows) instead of O(all remote rows).
+
+    Args:
+        conn: Remote connection with local_db attached
+        wm_ts: Last pushed limits timestamp, or None to reconcile everything
+
     Returns:
         True if limits are fully pushed (or there was nothing to push);
         False on any failure so the limits watermark is not advanced
     """
+    since, params = (" AND s.timestamp > ?", [wm_ts]) if wm_ts is not None else ("", [])
     try:
-        local_limits = conn.execute("SELECT COUNT(*) FROM local_db.limits_snapshots").fetchone()[0]
+        local_limits = conn.execute(
+            f"SELECT COUNT(*) FROM local_db.limits_snapshots s WHERE 1=1{since}", params
+        ).fetchone()[0]
         if local_limits == 0:
             return True
         existing_ts = [r[0] for r in conn.execute(
-            "SELECT timestamp FROM remote.limits_snapshots"
+            f"SELECT s.timestamp FROM remote.limits_snapshots s WHERE 1=1{since}", params
         ).fetchall()]
         if existing_ts:
             conn.execute("CREATE OR REPLACE TEMP TABLE existing_limits_ts (timestamp VARCHAR)")
             conn.executemany("INSERT INTO existing_limits_ts VALUES (?)", [(t,) for t in existing_ts])
-            conn.execute("""
+            conn.execute(f"""
                 INSERT INTO remote.limits_snapshots
                 SELECT s.* FROM local_db.limits_snapshots s
                 WHERE NOT EXISTS (
                     SELECT 1 FROM existing_limits_ts e WHERE e.timestamp = s.timestamp
-                )
-            """)
+                ){since}
+            """, params)
             conn.execute("DROP TABLE existing_limits_ts")
         else:
-            conn.execute("INSERT INTO remote.limits_snapshots SELECT * FROM local_db.limits_snapshots")
+            conn.execute(
+                f"INSERT INTO remote.limits_snapshots SELECT s.* FROM local_db.limits_snapshots s WHERE 1=1{since}",
+                params,
+            )
         return True
     except Exception:
         return False
@@ -481,18 +495,17 @@ def push_to_remote(local_db_path: Path, full: bool = False) -> dict:
                 _push_usage_full(conn)
 
         if new_limits:
-            limits_ok = _push_limits(conn)
+            limits_ok = _push_limits(conn, None if full else state["wm_limits_ts"])
 
         # Remote-total/device reporting and pricing sync only off the hot
         # path: on an incremental push these remote scans cost more than
         # the insert itself.
         if not incremental:
             _push_model_pricing(conn)
-            remote_total = conn.execute("SELECT COUNT(*) FROM remote.usage_records").fetchone()[0]
+            remote_total, devices = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT device_id) FROM remote.usage_records"
+            ).fetchone()
             new_records = remote_total - before
-            devices = conn.execute(
-                "SELECT COUNT(DISTINCT device_id) FROM remote.usage_records WHERE device_id IS NOT NULL"
-            ).fetchone()[0]
     finally:
         conn.close()
 
@@ -580,9 +593,13 @@ def repair_remote(local_db_path: Path) -> dict:
         local_nulls = conn.execute(
             "SELECT COUNT(*) FROM local_db.usage_records WHERE device_id IS NULL"
         ).fetchone()[0]
-        remote_nulls = conn.execute(
-            "SELECT COUNT(*) FROM remote.usage_records WHERE device_id IS NULL"
-        ).fetchone()[0]
+        # Per-device remote counts in one round trip; NULL devices included
+        before = {
+            r[0]: r[1] for r in conn.execute(
+                "SELECT COALESCE(device_id, '<null>'), COUNT(*) FROM remote.usage_records GROUP BY 1"
+            ).fetchall()
+        }
+        remote_nulls = before.get("<null>", 0)
         # NULL-device rows can't be attributed to an install: with rows on
         # both sides the refill would count the same usage twice
         if local_nulls and remote_nulls:
@@ -592,11 +609,6 @@ def repair_remote(local_db_path: Path) -> dict:
                 "device (ccg update usage --rebuild) before repairing."
             )
         remote_cols = _remote_usage_columns(conn)
-        before = {
-            r[0]: r[1] for r in conn.execute(
-                "SELECT COALESCE(device_id, '<null>'), COUNT(*) FROM remote.usage_records GROUP BY 1"
-            ).fetchall()
-        }
 
         # 1. Full client-side backup of the remote table, as-is
         remote_rows = _fetch_remote_usage_arrow(conn)
@@ -746,8 +758,25 @@ def load_historical_records(
 def get_database_stats() -> dict:
     conn = connect_remote()
     try:
-        total_records = conn.execute("SELECT COUNT(*) FROM remote.usage_records").fetchone()[0]
-        total_days = conn.execute("SELECT COUNT(DISTINCT date) FROM remote.usage_records").fetchone()[0]
+        # Every scalar in one remote round trip -- remote daily_snapshots is
+        # left empty because quack lacks DELETE/ON CONFLICT for upserts, so
+        # everything aggregates directly from usage_records.
+        (
+            total_records, total_days, oldest_date, newest_date, newest_timestamp,
+            total_tokens, total_prompts, total_responses, total_sessions,
+        ) = conn.execute("""
+            SELECT
+                COUNT(*),
+                COUNT(DISTINCT date),
+                MIN(date),
+                MAX(date),
+                MAX(timestamp),
+                SUM(total_tokens),
+                SUM(CASE WHEN message_type = 'user' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN message_type = 'assistant' THEN 1 ELSE 0 END),
+                COUNT(DISTINCT session_id)
+            FROM remote.usage_records
+        """).fetchone()
 
         if total_records == 0:
             return {
@@ -760,36 +789,13 @@ def get_database_stats() -> dict:
                 "avg_cost_per_response": 0.0,
             }
 
-        date_range = conn.execute("SELECT MIN(date), MAX(date) FROM remote.usage_records").fetchone()
-        oldest_date, newest_date = date_range
-
-        # Aggregate directly from usage_records -- remote daily_snapshots is
-        # left empty because quack lacks DELETE/ON CONFLICT for upserts.
-        newest_timestamp = conn.execute(
-            "SELECT MAX(timestamp) FROM remote.usage_records"
-        ).fetchone()[0]
-
-        agg = conn.execute("""
-            SELECT
-                SUM(total_tokens),
-                SUM(CASE WHEN message_type = 'user' THEN 1 ELSE 0 END),
-                SUM(CASE WHEN message_type = 'assistant' THEN 1 ELSE 0 END),
-                COUNT(DISTINCT session_id)
-            FROM remote.usage_records
-        """).fetchone()
-        total_tokens = agg[0] or 0
-        total_prompts = agg[1] or 0
-        total_responses = agg[2] or 0
-        total_sessions = agg[3] or 0
-
-        tokens_by_model = {}
-        model_rows = conn.execute("""
-            SELECT model, SUM(total_tokens) as tokens
-            FROM remote.usage_records WHERE model IS NOT NULL
-            GROUP BY model ORDER BY tokens DESC
-        """).fetchall()
-        tokens_by_model = {r[0]: r[1] for r in model_rows if r[0]}
+        total_tokens = total_tokens or 0
+        total_prompts = total_prompts or 0
+        total_responses = total_responses or 0
+        total_sessions = total_sessions or 0
 
+        # Tokens and cost per model share one round trip; without a usable
+        # remote model_pricing only the token split is fetched.
         total_cost = 0.0
         cost_by_model = {}
         try:
@@ -800,14 +806,28 @@ def get_database_stats() -> dict:
                     mp.input_price_per_mtok, mp.output_price_per_mtok,
                     mp.cache_write_price_per_mtok, mp.cache_read_price_per_mtok,
                     SUM(COALESCE(ur.cache_creation_1h_tokens, 0)),
-                    mp.cache_write_1h_price_per_mtok
+                    mp.cache_write_1h_price_per_mtok,
+                    SUM(ur.total_tokens) as tokens
                 FROM remote.usage_records ur
                 LEFT JOIN remote.model_pricing mp ON ur.model = mp.model_name
                 WHERE ur.model IS NOT NULL
                 GROUP BY ur.model, mp.input_price_per_mtok, mp.output_price_per_mtok,
                          mp.cache_write_price_per_mtok, mp.cache_read_price_per_mtok,
                          mp.cache_write_1h_price_per_mtok
+                ORDER BY tokens DESC
+            """).fetchall()
+        except Exception:
+            cost_rows = None
+
+        if cost_rows is None:
+            model_rows = conn.execute("""
+                SELECT model, SUM(total_tokens) as tokens
+                FROM remote.usage_records WHERE model IS NOT NULL
+                GROUP BY model ORDER BY tokens DESC
             """).fetchall()
+            tokens_by_model = {r[0]: r[1] for r in model_rows if r[0]}
+        else:
+            tokens_by_model = {r[0]: r[11] for r in cost_rows if r[0]}
             for row in cost_rows:
                 write_1h_price = row[10] if row[10] is not None else (row[7] or 0) * 1.6
                 model_cost = (
@@ -819,8 +839,6 @@ def get_database_stats() -> dict:
                 )
                 cost_by_model[row[0]] = model_cost
                 total_cost += model_cost
-        except Exception:
-            pass
 
         return {
             "total_records": total_records,
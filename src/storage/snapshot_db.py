@@ -1,10 +1,15 @@
 #region Imports
+import atexit
+import functools
 import json
+import os
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from datetime import date, datetime
 from pathlib import Path
 
-from src.models.usage_record import UsageRecord
+from src.models.usage_record import TokenUsage, UsageRecord
 
 #endregion
 
@@ -12,6 +17,181 @@ from src.models.usage_record import UsageRecord
 #region Constants
 DEFAULT_DB_PATH = Path.home() / ".claude" / "usage" / "usage_history.db"
 DEVICE_COLUMNS = ["device_id", "device_name", "device_type"]
+MODEL_PRICING_PATH = Path(__file__).parent.parent / "data" / "model_pricing.json"
+
+# Hardcoded fallback pricing, used when model_pricing.json is missing,
+# unreadable, or lists no models
+FALLBACK_MODEL_PRICING: tuple[tuple, ...] = (
+    ('claude-opus-4-5-20251101', 15.00, 75.00, 18.75, 1.50, 30.00, 'Claude Opus 4.5'),
+    ('claude-opus-4-1-20250805', 15.00, 75.00, 18.75, 1.50, 30.00, 'Claude Opus 4.1'),
+    ('claude-sonnet-4-5-20250929', 3.00, 15.00, 3.75, 0.30, 6.00, 'Claude Sonnet 4.5'),
+    ('claude-sonnet-4-20250514', 3.00, 15.00, 3.75, 0.30, 6.00, 'Claude Sonnet 4'),
+    ('claude-haiku-4-5-20251001', 1.00, 5.00, 1.25, 0.10, 2.00, 'Claude Haiku 4.5'),
+    ('claude-haiku-3-5-20241022', 0.80, 4.00, 1.00, 0.08, 1.60, 'Claude 3.5 Haiku'),
+    ('claude-sonnet-3-7-20250219', 3.00, 15.00, 3.75, 0.30, 6.00, 'Claude Sonnet 3.7'),
+    ('claude-opus-4-20250514', 15.00, 75.00, 18.75, 1.50, 30.00, 'Claude Opus 4'),
+    ('<synthetic>', 0.00, 0.00, 0.00, 0.00, 0.00, 'Test/synthetic model'),
+)
+
+# Rows per executemany() call when saving full-mode usage records
+SAVE_BATCH_SIZE = 10_000
+
+# Dates bound per `date IN (...)` daily-snapshot rebuild
+DATE_PARAM_CHUNK = 500
+
+# Paths bound per `file_path IN (...)` file_metadata delete
+PATH_PARAM_CHUNK = 500
+
+# Message ids bound per `message_uuid IN (...)` upgraded-date lookup
+UUID_PARAM_CHUNK = 500
+
+# save_snapshot SQL, issued once per batch or date chunk. sqlite3 caches
+# prepared statements per connection keyed on the SQL text, so each of
+# these is parsed once per call no matter how many chunks run.
+
+# Existing assistant row with smaller usage upgrades in place, never downgrades
+_UPGRADE_USAGE_RECORD = """
+    UPDATE usage_records
+    SET timestamp = ?, input_tokens = ?, output_tokens = ?,
+        cache_creation_tokens = ?, cache_read_tokens = ?,
+        total_tokens = ?, cache_creation_1h_tokens = ?
+    WHERE id = (
+        SELECT id FROM usage_records
+        WHERE message_uuid = ? AND message_type = 'assistant'
+        LIMIT 1
+    ) AND COALESCE(total_tokens, 0) < ?
+"""
+
+# Dates of stored assistant rows the upgrade above can rewrite; {placeholders}
+# is filled with one ? per message_uuid
+_SELECT_UPGRADE_DATES = """
+    SELECT DISTINCT date FROM usage_records
+    WHERE message_type = 'assistant' AND message_uuid IN ({placeholders})
+"""
+
+# Insert gated on both dedupe keys; parameters are a _usage_row() tuple
+_INSERT_USAGE_RECORD = """
+    INSERT OR IGNORE INTO usage_records (
+        date, timestamp, session_id, message_uuid, message_type,
+        model, folder, git_branch, version,
+        input_tokens, output_tokens,
+        cache_creation_tokens, cache_read_tokens, total_tokens,
+        cache_creation_1h_tokens,
+        device_id, device_name, device_type
+    )
+    SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13, ?14, ?15, ?16, ?17, ?18
+    WHERE NOT EXISTS (
+        SELECT 1 FROM usage_records
+        WHERE session_id = ?3 AND message_uuid = ?4
+    ) AND (?5 <> 'assistant' OR NOT EXISTS (
+        SELECT 1 FROM usage_records
+        WHERE message_uuid = ?4 AND message_type = 'assistant'
+    ))
+"""
+
+# Full-mode recompute of daily totals from usage_records for a set of dates;
+# {placeholders} is filled with one ? per date. ON CONFLICT updates the row in
+# place where REPLACE would delete and re-insert it.
+_REBUILD_DAILY_SNAPSHOTS = """
+    INSERT INTO daily_snapshots (
+        date, total_prompts, total_responses, total_sessions, total_tokens,
+        input_tokens, output_tokens, cache_creation_tokens,
+        cache_read_tokens, snapshot_timestamp,
+        device_id, device_name, device_type
+    )
+    SELECT
+        date,
+        SUM(CASE WHEN message_type = 'user' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN message_type = 'assistant' THEN 1 ELSE 0 END),
+        COUNT(DISTINCT session_id),
+        COALESCE(SUM(total_tokens), 0),
+        COALESCE(SUM(input_tokens), 0),
+        COALESCE(SUM(output_tokens), 0),
+        COALESCE(SUM(cache_creation_tokens), 0),
+        COALESCE(SUM(cache_read_tokens), 0),
+        ?, ?, ?, ?
+    FROM usage_records
+    WHERE date IN ({placeholders})
+    GROUP BY date
+    ON CONFLICT(date) DO UPDATE SET
+        total_prompts = excluded.total_prompts,
+        total_responses = excluded.total_responses,
+        total_sessions = excluded.total_sessions,
+        total_tokens = excluded.total_tokens,
+        input_tokens = excluded.input_tokens,
+        output_tokens = excluded.output_tokens,
+        cache_creation_tokens = excluded.cache_creation_tokens,
+        cache_read_tokens = excluded.cache_read_tokens,
+        snapshot_timestamp = excluded.snapshot_timestamp,
+        device_id = excluded.device_id,
+        device_name = excluded.device_name,
+        device_type = excluded.device_type
+"""
+
+# Aggregate-mode additive merge of one date's batch sums
+_MERGE_DAILY_SNAPSHOT = """
+    INSERT INTO daily_snapshots (
+        date, total_prompts, total_responses, total_sessions, total_tokens,
+        input_tokens, output_tokens, cache_creation_tokens,
+        cache_read_tokens, snapshot_timestamp,
+        device_id, device_name, device_type
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        total_prompts = total_prompts + excluded.total_prompts,
+        total_responses = total_responses + excluded.total_responses,
+        total_sessions = total_sessions + excluded.total_sessions,
+        total_tokens = total_tokens + excluded.total_tokens,
+        input_tokens = input_tokens + excluded.input_tokens,
+        output_tokens = output_tokens + excluded.output_tokens,
+        cache_creation_tokens = cache_creation_tokens + excluded.cache_creation_tokens,
+        cache_read_tokens = cache_read_tokens + excluded.cache_read_tokens,
+        snapshot_timestamp = excluded.snapshot_timestamp,
+        device_id = excluded.device_id,
+        device_name = excluded.device_name,
+        device_type = excluded.device_type
+"""
+
+# Schema revision stamped into PRAGMA user_version once init_database has
+# created tables/indexes and migrated columns. Bump on any DDL change.
+SCHEMA_VERSION = 2
+
+# Per-thread cache of connections for the stats and file-metadata helpers:
+# db path -> (connection, (st_dev, st_ino)). sqlite3 connections are bound to
+# their creating thread, hence threading.local.
+_CONN_CACHE = threading.local()
+
+# DB paths already initialized by this process. init_database runs on every
+# write path; the DDL + pricing seed cost is worth paying once per process,
+# not once per call.
+_INITIALIZED_DBS: set[str] = set()
+
+# get_database_stats results are reused for up to this many seconds while the
+# database file is unchanged (same inode, mtime and size); dashboards poll it
+# far more often than the data changes
+STATS_CACHE_TTL = 1.0
+
+# get_database_stats result for a missing or empty database
+_EMPTY_STATS = {
+    "total_records": 0,
+    "total_days": 0,
+    "oldest_date": None,
+    "newest_date": None,
+    "newest_timestamp": None,
+    "total_tokens": 0,
+    "total_prompts": 0,
+    "total_responses": 0,
+    "total_sessions": 0,
+    "tokens_by_model": {},
+    "cost_by_model": {},
+    "total_cost": 0.0,
+    "avg_tokens_per_session": 0,
+    "avg_tokens_per_response": 0,
+    "avg_cost_per_session": 0.0,
+    "avg_cost_per_response": 0.0,
+}
+
+# db path -> ((st_ino, st_mtime_ns, st_size), monotonic time, stats dict)
+_STATS_CACHE: dict[str, tuple[tuple[int, int, int], float, dict]] = {}
 #endregion
 
 
@@ -23,29 +203,26 @@ def load_model_pricing() -> list[tuple]:
     Load model pricing from JSON file with hardcoded fallback.
 
     Reads pricing data from src/data/model_pricing.json if available,
-    otherwise falls back to hardcoded defaults.
+    otherwise falls back to hardcoded defaults. The parse is cached per
+    file mtime, so repeated calls cost one stat().
 
     Returns:
         List of tuples: (model_name, input_price, output_price, cache_write, cache_read, notes)
     """
-    # Hardcoded fallback pricing
-    fallback_pricing = [
-        ('claude-opus-4-5-20251101', 15.00, 75.00, 18.75, 1.50, 30.00, 'Claude Opus 4.5'),
-        ('claude-opus-4-1-20250805', 15.00, 75.00, 18.75, 1.50, 30.00, 'Claude Opus 4.1'),
-        ('claude-sonnet-4-5-20250929', 3.00, 15.00, 3.75, 0.30, 6.00, 'Claude Sonnet 4.5'),
-        ('claude-sonnet-4-20250514', 3.00, 15.00, 3.75, 0.30, 6.00, 'Claude Sonnet 4'),
-        ('claude-haiku-4-5-20251001', 1.00, 5.00, 1.25, 0.10, 2.00, 'Claude Haiku 4.5'),
-        ('claude-haiku-3-5-20241022', 0.80, 4.00, 1.00, 0.08, 1.60, 'Claude 3.5 Haiku'),
-        ('claude-sonnet-3-7-20250219', 3.00, 15.00, 3.75, 0.30, 6.00, 'Claude Sonnet 3.7'),
-        ('claude-opus-4-20250514', 15.00, 75.00, 18.75, 1.50, 30.00, 'Claude Opus 4'),
-        ('<synthetic>', 0.00, 0.00, 0.00, 0.00, 0.00, 'Test/synthetic model'),
-    ]
+    try:
+        mtime_ns = MODEL_PRICING_PATH.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return list(_load_model_pricing_cached(mtime_ns))
+
 
+@functools.lru_cache(maxsize=1)
+def _load_model_pricing_cached(mtime_ns: int | None) -> tuple[tuple, ...]:
+    """Parse model_pricing.json; keyed on its mtime_ns (None when missing)."""
     try:
         # Try to load from JSON file
-        json_path = Path(__file__).parent.parent / "data" / "model_pricing.json"
-        if json_path.exists():
-            with open(json_path, encoding="utf-8") as f:
+        if mtime_ns is not None:
+            with open(MODEL_PRICING_PATH, encoding="utf-8") as f:
                 data = json.load(f)
 
             pricing = []
@@ -60,14 +237,96 @@ def load_model_pricing() -> list[tuple]:
                     model_data.get("cache_write_1h_per_mtok", round(cache_write * 1.6, 4)),
                     model_data.get("notes", ""),
                 ))
-            return pricing if pricing else fallback_pricing
+            return tuple(pricing) or FALLBACK_MODEL_PRICING
     except (json.JSONDecodeError, KeyError, OSError):
         pass
 
-    return fallback_pricing
+    return FALLBACK_MODEL_PRICING
+
+
+def _get_conn(db_path: Path) -> sqlite3.Connection:
+    """
+    Return this thread's cached connection to db_path, opening it if needed.
+
+    Reusing the connection keeps SQLite's page cache warm across the
+    frequent stats/metadata calls. The cached connection is dropped and
+    reopened when the file is gone or was replaced (different inode), e.g.
+    after a backup restore. Journal mode is left alone; only
+    connection-scoped pragmas are set.
 
+    Args:
+        db_path: Path to the SQLite database file
 
-def _add_device_columns_if_missing(cursor: sqlite3.Cursor, table_name: str) -> None:
+    Returns:
+        Open sqlite3 connection (do not close it)
+    """
+    cache = getattr(_CONN_CACHE, "conns", None)
+    if cache is None:
+        cache = _CONN_CACHE.conns = {}
+
+    key = str(db_path)
+    try:
+        st = db_path.stat()
+        identity = (st.st_dev, st.st_ino)
+    except OSError:
+        identity = None
+
+    cached = cache.get(key)
+    if cached is not None:
+        conn, cached_identity = cached
+        if identity is not None and identity == cached_identity:
+            return conn
+        conn.close()
+        del cache[key]
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    # Reads go straight through the OS page cache instead of read() copies
+    conn.execute("PRAGMA mmap_size=268435456")
+    if identity is None:
+        st = db_path.stat()
+        identity = (st.st_dev, st.st_ino)
+    cache[key] = (conn, identity)
+    return conn
+
+
+@atexit.register
+def _close_cached_connections() -> None:
+    """Close the calling thread's cached connections at interpreter exit."""
+    for conn, _ in getattr(_CONN_CACHE, "conns", {}).values():
+        conn.close()
+    _CONN_CACHE.conns = {}
+
+
+def _table_columns(cursor: sqlite3.Cursor, tables: list[str]) -> dict[str, set[str]]:
+    """
+    Snapshot the columns of the given tables in one catalog query.
+
+    Args:
+        cursor: SQLite cursor
+        tables: Table names to look up
+
+    Returns:
+        Dict of table name -> column names; missing tables are absent
+    """
+    placeholders = ", ".join("?" * len(tables))
+    cursor.execute(f"""
+        SELECT m.name, p.name
+        FROM sqlite_master m JOIN pragma_table_info(m.name) p
+        WHERE m.type = 'table' AND m.name IN ({placeholders})
+    """, tables)
+    schema: dict[str, set[str]] = {}
+    for table, column in cursor:
+        schema.setdefault(table, set()).add(column)
+    return schema
+
+
+def _add_device_columns_if_missing(
+    cursor: sqlite3.Cursor,
+    table_name: str,
+    existing_columns: set[str] | None = None,
+) -> None:
     """
     Add device metadata columns to a table if they don't exist.
 
@@ -76,21 +335,276 @@ def _add_device_columns_if_missing(cursor: sqlite3.Cursor, table_name: str) -> N
     Args:
         cursor: SQLite cursor
         table_name: Name of the table to modify
+        existing_columns: Columns already known to exist (from _table_columns);
+            looked up with PRAGMA table_info when omitted
     """
-    cursor.execute(f"PRAGMA table_info({table_name})")
-    existing_columns = {row[1] for row in cursor.fetchall()}
+    if existing_columns is None:
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        existing_columns = {row[1] for row in cursor}
 
     for col in DEVICE_COLUMNS:
         if col not in existing_columns:
             cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {col} TEXT")
 
 
+def _usage_row(
+    record: UsageRecord,
+    device_id: str | None,
+    device_name: str | None,
+    device_type: str | None,
+) -> tuple:
+    """
+    Flatten a record into usage_records insert parameters.
+
+    Column order: date, timestamp, session_id, message_uuid, message_type,
+    model, folder, git_branch, version, the six token columns (input, output,
+    cache_creation, cache_read, total, cache_creation_1h), then the three
+    device columns. Token columns are 0 for records without token_usage.
+    """
+    tu = record.token_usage
+    if tu is None:
+        tokens = (0, 0, 0, 0, 0, 0)
+    else:
+        tokens = (
+            tu.input_tokens,
+            tu.output_tokens,
+            tu.cache_creation_tokens,
+            tu.cache_read_tokens,
+            tu.total_tokens,
+            tu.cache_creation_1h_tokens,
+        )
+    return (
+        record.date_key,
+        record.timestamp.isoformat(),
+        record.session_id,
+        record.message_uuid,
+        record.message_type,
+        record.model,
+        record.folder,
+        record.git_branch,
+        record.version,
+        *tokens,
+        device_id,
+        device_name,
+        device_type,
+    )
+
+
+def _copy_stats(stats: dict) -> dict:
+    """Copy a cached get_database_stats result, including its per-model dicts."""
+    return {
+        **stats,
+        "tokens_by_model": dict(stats["tokens_by_model"]),
+        "cost_by_model": dict(stats["cost_by_model"]),
+    }
+
+
+def _scan_mtime_size(all_files: list[Path]) -> dict[str, tuple[int, int]]:
+    """
+    Stat each file once with os.stat on its path string, skipping the
+    pathlib round-trip. Files that fail to stat are left out.
+
+    Args:
+        all_files: File paths to stat
+
+    Returns:
+        Dict of path string -> (mtime_ns, size_bytes)
+    """
+    current: dict[str, tuple[int, int]] = {}
+    for file_path in all_files:
+        path_str = os.fspath(file_path)
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            continue
+        current[path_str] = (st.st_mtime_ns, st.st_size)
+    return current
+
+
 #endregion
 
 
 #region Functions
 
 
+def _create_schema(cursor: sqlite3.Cursor) -> None:
+    """
+    Create tables and indexes, and migrate columns of older databases.
+
+    Every statement is idempotent. Bump SCHEMA_VERSION whenever this
+    changes so existing databases pick the change up.
+
+    Args:
+        cursor: SQLite cursor
+    """
+    # Table for daily aggregated snapshots
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS daily_snapshots (
+            date TEXT PRIMARY KEY,
+            total_prompts INTEGER NOT NULL,
+            total_responses INTEGER NOT NULL,
+            total_sessions INTEGER NOT NULL,
+            total_tokens INTEGER NOT NULL,
+            input_tokens INTEGER NOT NULL,
+            output_tokens INTEGER NOT NULL,
+            cache_creation_tokens INTEGER NOT NULL,
+            cache_read_tokens INTEGER NOT NULL,
+            snapshot_timestamp TEXT NOT NULL,
+            device_id TEXT,
+            device_name TEXT,
+            device_type TEXT
+        )
+    """)
+
+    # Table for detailed usage records
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS usage_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            session_id TEXT NOT NULL,
+            message_uuid TEXT NOT NULL,
+            message_type TEXT NOT NULL,
+            model TEXT,
+            folder TEXT NOT NULL,
+            git_branch TEXT,
+            version TEXT NOT NULL,
+            input_tokens INTEGER NOT NULL,
+            output_tokens INTEGER NOT NULL,
+            cache_creation_tokens INTEGER NOT NULL,
+            cache_read_tokens INTEGER NOT NULL,
+            total_tokens INTEGER NOT NULL,
+            cache_creation_1h_tokens INTEGER DEFAULT 0,
+            device_id TEXT,
+            device_name TEXT,
+            device_type TEXT,
+            UNIQUE(session_id, message_uuid)
+        )
+    """)
+
+    # Date-range reads come back ORDER BY date, timestamp; the compound
+    # index serves both the range and the sort, and its date prefix
+    # covers everything the old single-column index did.
+    cursor.execute("DROP INDEX IF EXISTS idx_usage_records_date")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_usage_records_date_timestamp
+        ON usage_records(date, timestamp)
+    """)
+
+    # Global assistant dedupe in save_snapshot looks rows up by
+    # message_uuid alone, which the UNIQUE(session_id, message_uuid)
+    # index can't serve
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_usage_records_message_uuid
+        ON usage_records(message_uuid, message_type)
+    """)
+
+    # Table for usage limits snapshots
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS limits_snapshots (
+            timestamp TEXT PRIMARY KEY,
+            date TEXT NOT NULL,
+            session_pct INTEGER,
+            week_pct INTEGER,
+            opus_pct INTEGER,
+            session_reset TEXT,
+            week_reset TEXT,
+            opus_reset TEXT,
+            device_id TEXT,
+            device_name TEXT,
+            device_type TEXT
+        )
+    """)
+
+    # Index for faster date-based queries on limits
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_limits_snapshots_date
+        ON limits_snapshots(date)
+    """)
+
+    # Table for tracking JSONL file metadata (for incremental parsing)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS file_metadata (
+            file_path TEXT PRIMARY KEY,
+            mtime_ns INTEGER NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            record_count INTEGER NOT NULL,
+            last_parsed TEXT NOT NULL
+        )
+    """)
+
+    # Table for model pricing
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS model_pricing (
+            model_name TEXT PRIMARY KEY,
+            input_price_per_mtok REAL NOT NULL,
+            output_price_per_mtok REAL NOT NULL,
+            cache_write_price_per_mtok REAL NOT NULL,
+            cache_read_price_per_mtok REAL NOT NULL,
+            last_updated TEXT NOT NULL,
+            notes TEXT,
+            cache_write_1h_price_per_mtok REAL
+        )
+    """)
+
+    # Per-file aggregate contributions ledger (aggregate storage mode):
+    # what each transcript file last added to daily_snapshots, so a
+    # reparse of a grown file applies only the delta instead of re-adding
+    # the whole file.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS file_contributions (
+            file_path TEXT NOT NULL,
+            date TEXT NOT NULL,
+            prompts INTEGER NOT NULL,
+            responses INTEGER NOT NULL,
+            sessions INTEGER NOT NULL,
+            input_tokens INTEGER NOT NULL,
+            output_tokens INTEGER NOT NULL,
+            cache_creation_tokens INTEGER NOT NULL,
+            cache_read_tokens INTEGER NOT NULL,
+            total_tokens INTEGER NOT NULL,
+            PRIMARY KEY (file_path, date)
+        )
+    """)
+
+    # Column migrations for databases created by older versions, checked
+    # against one catalog snapshot instead of a PRAGMA per table
+    schema = _table_columns(
+        cursor, ["daily_snapshots", "usage_records", "limits_snapshots", "model_pricing"]
+    )
+
+    # Add device columns if they don't exist (for migration)
+    for table_name in ("daily_snapshots", "usage_records", "limits_snapshots"):
+        _add_device_columns_if_missing(cursor, table_name, schema[table_name])
+
+    # 1h cache-write split (bills at 2x base input vs 1.25x for 5m)
+    if "cache_creation_1h_tokens" not in schema["usage_records"]:
+        cursor.execute(
+            "ALTER TABLE usage_records ADD COLUMN cache_creation_1h_tokens INTEGER DEFAULT 0"
+        )
+
+    if "cache_write_1h_price_per_mtok" not in schema["model_pricing"]:
+        cursor.execute(
+            "ALTER TABLE model_pricing ADD COLUMN cache_write_1h_price_per_mtok REAL"
+        )
+
+    # Stats indexes, created after the column migrations since the covering
+    # index needs cache_creation_1h_tokens. The per-model cost rollup in
+    # get_database_stats reads only this index, already grouped by model;
+    # MIN/MAX(date) is served by idx_usage_records_date_timestamp.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_usage_records_model_tokens
+        ON usage_records(
+            model, total_tokens, input_tokens, output_tokens,
+            cache_creation_tokens, cache_read_tokens, cache_creation_1h_tokens
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_daily_snapshots_snapshot_timestamp
+        ON daily_snapshots(snapshot_timestamp)
+    """)
+
+
 def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
     """
     Initialize the SQLite database for historical snapshots.
@@ -105,167 +619,54 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
     Raises:
         sqlite3.Error: If database initialization fails
     """
+    if str(db_path) in _INITIALIZED_DBS and db_path.exists():
+        return
+
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(db_path)
     try:
         cursor = conn.cursor()
 
-        # Table for daily aggregated snapshots
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS daily_snapshots (
-                date TEXT PRIMARY KEY,
-                total_prompts INTEGER NOT NULL,
-                total_responses INTEGER NOT NULL,
-                total_sessions INTEGER NOT NULL,
-                total_tokens INTEGER NOT NULL,
-                input_tokens INTEGER NOT NULL,
-                output_tokens INTEGER NOT NULL,
-                cache_creation_tokens INTEGER NOT NULL,
-                cache_read_tokens INTEGER NOT NULL,
-                snapshot_timestamp TEXT NOT NULL,
-                device_id TEXT,
-                device_name TEXT,
-                device_type TEXT
-            )
-        """)
-
-        # Add device columns if they don't exist (for migration)
-        _add_device_columns_if_missing(cursor, "daily_snapshots")
-
-        # Table for detailed usage records
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS usage_records (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                session_id TEXT NOT NULL,
-                message_uuid TEXT NOT NULL,
-                message_type TEXT NOT NULL,
-                model TEXT,
-                folder TEXT NOT NULL,
-                git_branch TEXT,
-                version TEXT NOT NULL,
-                input_tokens INTEGER NOT NULL,
-                output_tokens INTEGER NOT NULL,
-                cache_creation_tokens INTEGER NOT NULL,
-                cache_read_tokens INTEGER NOT NULL,
-                total_tokens INTEGER NOT NULL,
-                cache_creation_1h_tokens INTEGER DEFAULT 0,
-                device_id TEXT,
-                device_name TEXT,
-                device_type TEXT,
-                UNIQUE(session_id, message_uuid)
-            )
-        """)
-
-        # Add device columns if they don't exist (for migration)
-        _add_device_columns_if_missing(cursor, "usage_records")
-
-        # 1h cache-write split (bills at 2x base input vs 1.25x for 5m)
-        cursor.execute("PRAGMA table_info(usage_records)")
-        if "cache_creation_1h_tokens" not in {row[1] for row in cursor.fetchall()}:
-            cursor.execute(
-                "ALTER TABLE usage_records ADD COLUMN cache_creation_1h_tokens INTEGER DEFAULT 0"
-            )
-
-        # Index for faster date-based queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_usage_records_date
-            ON usage_records(date)
-        """)
-
-        # Table for usage limits snapshots
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS limits_snapshots (
-                timestamp TEXT PRIMARY KEY,
-                date TEXT NOT NULL,
-                session_pct INTEGER,
-                week_pct INTEGER,
-                opus_pct INTEGER,
-                session_reset TEXT,
-                week_reset TEXT,
-                opus_reset TEXT,
-                device_id TEXT,
-                device_name TEXT,
-                device_type TEXT
-            )
-        """)
-
-        # Add device columns if they don't exist (for migration)
-        _add_device_columns_if_missing(cursor, "limits_snapshots")
-
-        # Index for faster date-based queries on limits
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_limits_snapshots_date
-            ON limits_snapshots(date)
-        """)
-
-        # Table for tracking JSONL file metadata (for incremental parsing)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS file_metadata (
-                file_path TEXT PRIMARY KEY,
-                mtime_ns INTEGER NOT NULL,
-                size_bytes INTEGER NOT NULL,
-                record_count INTEGER NOT NULL,
-                last_parsed TEXT NOT NULL
-            )
-        """)
-
-        # Table for model pricing
+        # Schema DDL and column migrations only run for databases older than
+        # SCHEMA_VERSION; hooks start a fresh process per event, so the
+        # in-process cache alone doesn't spare them this work.
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] < SCHEMA_VERSION:
+            _create_schema(cursor)
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        # Populate pricing data from JSON file (with fallback). Only rows that
+        # are missing or differ are written, so an unchanged seed costs one
+        # SELECT instead of a REPLACE (delete + insert) per model.
+        pricing_data = load_model_pricing()
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS model_pricing (
-                model_name TEXT PRIMARY KEY,
-                input_price_per_mtok REAL NOT NULL,
-                output_price_per_mtok REAL NOT NULL,
-                cache_write_price_per_mtok REAL NOT NULL,
-                cache_read_price_per_mtok REAL NOT NULL,
-                last_updated TEXT NOT NULL,
-                notes TEXT,
-                cache_write_1h_price_per_mtok REAL
-            )
+            SELECT model_name, input_price_per_mtok, output_price_per_mtok,
+                   cache_write_price_per_mtok, cache_read_price_per_mtok,
+                   cache_write_1h_price_per_mtok, notes
+            FROM model_pricing
         """)
+        existing_pricing = {row[0]: row for row in cursor}
 
-        # Per-file aggregate contributions ledger (aggregate storage mode):
-        # what each transcript file last added to daily_snapshots, so a
-        # reparse of a grown file applies only the delta instead of re-adding
-        # the whole file.
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS file_contributions (
-                file_path TEXT NOT NULL,
-                date TEXT NOT NULL,
-                prompts INTEGER NOT NULL,
-                responses INTEGER NOT NULL,
-                sessions INTEGER NOT NULL,
-                input_tokens INTEGER NOT NULL,
-                output_tokens INTEGER NOT NULL,
-                cache_creation_tokens INTEGER NOT NULL,
-                cache_read_tokens INTEGER NOT NULL,
-                total_tokens INTEGER NOT NULL,
-                PRIMARY KEY (file_path, date)
-            )
-        """)
-
-        cursor.execute("PRAGMA table_info(model_pricing)")
-        if "cache_write_1h_price_per_mtok" not in {row[1] for row in cursor.fetchall()}:
-            cursor.execute(
-                "ALTER TABLE model_pricing ADD COLUMN cache_write_1h_price_per_mtok REAL"
-            )
-
-        # Populate pricing data from JSON file (with fallback)
-        pricing_data = load_model_pricing()
-
+        # One timestamp for the whole seed, bound through a single prepared
+        # statement rather than re-bound per row
         timestamp = datetime.now().isoformat()
-        for model_name, input_price, output_price, cache_write, cache_read, cache_write_1h, notes in pricing_data:
-            cursor.execute("""
-                INSERT OR REPLACE INTO model_pricing (
-                    model_name, input_price_per_mtok, output_price_per_mtok,
-                    cache_write_price_per_mtok, cache_read_price_per_mtok,
-                    cache_write_1h_price_per_mtok, last_updated, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (model_name, input_price, output_price, cache_write, cache_read, cache_write_1h, timestamp, notes))
+        cursor.executemany("""
+            INSERT OR REPLACE INTO model_pricing (
+                model_name, input_price_per_mtok, output_price_per_mtok,
+                cache_write_price_per_mtok, cache_read_price_per_mtok,
+                cache_write_1h_price_per_mtok, last_updated, notes
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (model_name, input_price, output_price, cache_write, cache_read, cache_write_1h, timestamp, notes)
+            for model_name, input_price, output_price, cache_write, cache_read, cache_write_1h, notes in pricing_data
+            if existing_pricing.get(model_name) != (
+                model_name, input_price, output_price, cache_write, cache_read, cache_write_1h, notes
+            )
+        ])
 
         conn.commit()
+        _INITIALIZED_DBS.add(str(db_path))
     finally:
         conn.close()
 
@@ -303,239 +704,124 @@ def save_snapshot(
 
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path)
+    # Autocommit connection with one explicit write transaction: BEGIN
+    # IMMEDIATE takes the write lock up front, so a concurrent writer waits
+    # on the busy timeout instead of failing a read->write lock upgrade, and
+    # each SAVE_BATCH_SIZE chunk pays for a single journal sync. Closing
+    # without COMMIT rolls the open transaction back.
+    conn = sqlite3.connect(db_path, isolation_level=None)
     saved_count = 0
 
     try:
         cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
 
         # Save individual records only if in "full" mode
         if storage_mode == "full":
-            for record in records:
-                # Get token values (0 for user messages without token_usage)
-                input_tokens = record.token_usage.input_tokens if record.token_usage else 0
-                output_tokens = record.token_usage.output_tokens if record.token_usage else 0
-                cache_creation_tokens = record.token_usage.cache_creation_tokens if record.token_usage else 0
-                cache_read_tokens = record.token_usage.cache_read_tokens if record.token_usage else 0
-                total_tokens = record.token_usage.total_tokens if record.token_usage else 0
-                cache_creation_1h = record.token_usage.cache_creation_1h_tokens if record.token_usage else 0
-
-                # Assistant rows dedupe GLOBALLY on the billed-response id
-                # (session forks replay identical responses under new session
-                # ids); user rows stay session-scoped. An existing row with
-                # smaller usage upgrades in place (mid-stream partial
-                # capture), never downgrades.
-                if record.message_type == "assistant":
-                    cursor.execute(
-                        "SELECT id, total_tokens FROM usage_records "
-                        "WHERE message_uuid = ? AND message_type = 'assistant'",
-                        (record.message_uuid,),
-                    )
-                else:
+            # Assistant rows dedupe GLOBALLY on the billed-response id
+            # (session forks replay identical responses under new session
+            # ids); user rows stay session-scoped. Records are written in
+            # SAVE_BATCH_SIZE chunks, each committed on its own so the
+            # rollback journal and the row tuples stay bounded. Duplicates
+            # within a chunk are folded here first: the first occurrence keeps
+            # its identity columns and picks up the largest usage seen
+            # (mid-stream partial capture). Duplicates across chunks reach the
+            # upgrade UPDATE below, which applies the same rule against the
+            # DB. A retry after a partial failure is idempotent.
+            upgraded_dates: set[str] = set()
+            for i in range(0, len(records), SAVE_BATCH_SIZE):
+                if i:
+                    cursor.execute("COMMIT")
+                    cursor.execute("BEGIN IMMEDIATE")
+
+                batch: list[tuple] = []
+                assistant_rows: dict[str, int] = {}
+                for record in records[i:i + SAVE_BATCH_SIZE]:
+                    row = _usage_row(record, device_id, device_name, device_type)
+                    if record.message_type == "assistant":
+                        index = assistant_rows.get(record.message_uuid)
+                        if index is not None:
+                            seen = batch[index]
+                            if row[13] > seen[13]:
+                                batch[index] = seen[:1] + row[1:2] + seen[2:9] + row[9:15] + seen[15:]
+                            continue
+                        assistant_rows[record.message_uuid] = len(batch)
+                    batch.append(row)
+
+                # Existing row with smaller usage upgrades in place, never
+                # downgrades. The match is global, so the stored row may sit
+                # on a date outside this batch; its date joins the rebuild set.
+                upgrades = [
+                    (row[1], *row[9:15], row[3], row[13])
+                    for row in batch if row[4] == "assistant"
+                ]
+                for j in range(0, len(upgrades), UUID_PARAM_CHUNK):
+                    uuid_chunk = [upgrade[7] for upgrade in upgrades[j:j + UUID_PARAM_CHUNK]]
+                    placeholders = ", ".join("?" * len(uuid_chunk))
                     cursor.execute(
-                        "SELECT id, total_tokens FROM usage_records "
-                        "WHERE session_id = ? AND message_uuid = ?",
-                        (record.session_id, record.message_uuid),
+                        _SELECT_UPGRADE_DATES.format(placeholders=placeholders),
+                        uuid_chunk,
                     )
-                existing = cursor.fetchone()
-                if existing is not None:
-                    if record.message_type == "assistant" and total_tokens > (existing[1] or 0):
-                        cursor.execute("""
-                            UPDATE usage_records
-                            SET timestamp = ?, input_tokens = ?, output_tokens = ?,
-                                cache_creation_tokens = ?, cache_read_tokens = ?,
-                                total_tokens = ?, cache_creation_1h_tokens = ?
-                            WHERE id = ?
-                        """, (
-                            record.timestamp.isoformat(),
-                            input_tokens, output_tokens,
-                            cache_creation_tokens, cache_read_tokens,
-                            total_tokens, cache_creation_1h, existing[0],
-                        ))
-                    continue
-
-                try:
-                    cursor.execute("""
-                        INSERT INTO usage_records (
-                            date, timestamp, session_id, message_uuid, message_type,
-                            model, folder, git_branch, version,
-                            input_tokens, output_tokens,
-                            cache_creation_tokens, cache_read_tokens, total_tokens,
-                            cache_creation_1h_tokens,
-                            device_id, device_name, device_type
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        record.date_key,
-                        record.timestamp.isoformat(),
-                        record.session_id,
-                        record.message_uuid,
-                        record.message_type,
-                        record.model,
-                        record.folder,
-                        record.git_branch,
-                        record.version,
-                        input_tokens,
-                        output_tokens,
-                        cache_creation_tokens,
-                        cache_read_tokens,
-                        total_tokens,
-                        cache_creation_1h,
-                        device_id,
-                        device_name,
-                        device_type,
-                    ))
-                    saved_count += 1
-                except sqlite3.IntegrityError:
-                    # Same key inserted concurrently between check and insert
-                    pass
+                    upgraded_dates.update(date for (date,) in cursor.fetchall())
+                cursor.executemany(_UPGRADE_USAGE_RECORD, upgrades)
+
+                # The NOT EXISTS gates skip keys already stored (checked up
+                # front so skipped rows don't burn AUTOINCREMENT ids); OR
+                # IGNORE keeps any remaining UNIQUE conflict in C instead of
+                # raising IntegrityError per row.
+                changes_before = conn.total_changes
+                cursor.executemany(_INSERT_USAGE_RECORD, batch)
+                saved_count += conn.total_changes - changes_before
 
         # Update daily snapshots (aggregate by date)
         if storage_mode == "full":
-            # In full mode, only update dates that have records in usage_records
-            # IMPORTANT: Never use REPLACE - it would delete old data when JSONL files age out
-            # Instead, recalculate only for dates that currently have records
+            # Rebuild daily snapshots only for dates present in this batch
+            # plus the dates of stored rows the upgrade may have rewritten.
+            # IMPORTANT: Never REPLACE other dates - it would delete old data
+            # when JSONL files age out. One set-based upsert replaces the
+            # previous per-date query loop.
             timestamp = datetime.now().isoformat()
+            touched_dates = sorted({record.date_key for record in records} | upgraded_dates)
+            # Bound the IN list well under SQLITE_MAX_VARIABLE_NUMBER (999 on
+            # builds older than 3.32) for multi-year backfills
+            for i in range(0, len(touched_dates), DATE_PARAM_CHUNK):
+                date_chunk = touched_dates[i:i + DATE_PARAM_CHUNK]
+                placeholders = ", ".join("?" * len(date_chunk))
+                cursor.execute(
+                    _REBUILD_DAILY_SNAPSHOTS.format(placeholders=placeholders),
+                    (timestamp, device_id, device_name, device_type, *date_chunk),
+                )
+        else:
+            # In aggregate mode, compute from incoming records (same per-date
+            # sums the file-delta path uses)
+            from src.storage.duckdb_backend import _aggregate_by_date
 
-            # Get all dates that currently have usage_records
-            cursor.execute("SELECT DISTINCT date FROM usage_records")
-            dates_with_records = [row[0] for row in cursor.fetchall()]
-
-            for date in dates_with_records:
-                # Calculate totals for this date from usage_records
-                cursor.execute("""
-                    SELECT
-                        SUM(CASE WHEN message_type = 'user' THEN 1 ELSE 0 END) as total_prompts,
-                        SUM(CASE WHEN message_type = 'assistant' THEN 1 ELSE 0 END) as total_responses,
-                        COUNT(DISTINCT session_id) as total_sessions,
-                        SUM(total_tokens) as total_tokens,
-                        SUM(input_tokens) as input_tokens,
-                        SUM(output_tokens) as output_tokens,
-                        SUM(cache_creation_tokens) as cache_creation_tokens,
-                        SUM(cache_read_tokens) as cache_read_tokens
-                    FROM usage_records
-                    WHERE date = ?
-                """, (date,))
-
-                row = cursor.fetchone()
-
-                # Use INSERT OR REPLACE only for dates that currently have data
-                # This preserves historical daily_snapshots for dates no longer in usage_records
-                cursor.execute("""
-                    INSERT OR REPLACE INTO daily_snapshots (
-                        date, total_prompts, total_responses, total_sessions, total_tokens,
-                        input_tokens, output_tokens, cache_creation_tokens,
-                        cache_read_tokens, snapshot_timestamp,
-                        device_id, device_name, device_type
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    date,
-                    row[0] or 0,
-                    row[1] or 0,
-                    row[2] or 0,
-                    row[3] or 0,
-                    row[4] or 0,
-                    row[5] or 0,
-                    row[6] or 0,
-                    row[7] or 0,
+            daily_aggregates = _aggregate_by_date(records)
+
+            # Add to existing totals (or insert fresh) in one additive UPSERT
+            # per date instead of a SELECT-then-write round trip
+            timestamp = datetime.now().isoformat()
+            cursor.executemany(_MERGE_DAILY_SNAPSHOT, [
+                (
+                    date_key,
+                    agg["prompts"],
+                    agg["responses"],
+                    agg["sessions"],
+                    agg["total_tokens"],
+                    agg["input_tokens"],
+                    agg["output_tokens"],
+                    agg["cache_creation_tokens"],
+                    agg["cache_read_tokens"],
                     timestamp,
                     device_id,
                     device_name,
                     device_type,
-                ))
-        else:
-            # In aggregate mode, compute from incoming records
-            from collections import defaultdict
-            daily_aggregates = defaultdict(lambda: {
-                "prompts": 0,
-                "responses": 0,
-                "sessions": set(),
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "cache_creation_tokens": 0,
-                "cache_read_tokens": 0,
-                "total_tokens": 0,
-            })
-
-            for record in records:
-                date_key = record.date_key
-                daily_aggregates[date_key]["sessions"].add(record.session_id)
-
-                # Count message types
-                if record.is_user_prompt:
-                    daily_aggregates[date_key]["prompts"] += 1
-                elif record.is_assistant_response:
-                    daily_aggregates[date_key]["responses"] += 1
-
-                # Token usage only on assistant messages
-                if record.token_usage:
-                    daily_aggregates[date_key]["input_tokens"] += record.token_usage.input_tokens
-                    daily_aggregates[date_key]["output_tokens"] += record.token_usage.output_tokens
-                    daily_aggregates[date_key]["cache_creation_tokens"] += record.token_usage.cache_creation_tokens
-                    daily_aggregates[date_key]["cache_read_tokens"] += record.token_usage.cache_read_tokens
-                    daily_aggregates[date_key]["total_tokens"] += record.token_usage.total_tokens
-
-            # Insert or update daily snapshots
-            timestamp = datetime.now().isoformat()
-            for date_key, agg in daily_aggregates.items():
-                # Get existing data for this date to merge with new data
-                cursor.execute("""
-                    SELECT total_prompts, total_responses, total_sessions, total_tokens,
-                           input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens
-                    FROM daily_snapshots WHERE date = ?
-                """, (date_key,))
-                existing = cursor.fetchone()
-
-                if existing:
-                    # Merge with existing (add to existing totals)
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO daily_snapshots (
-                            date, total_prompts, total_responses, total_sessions, total_tokens,
-                            input_tokens, output_tokens, cache_creation_tokens,
-                            cache_read_tokens, snapshot_timestamp,
-                            device_id, device_name, device_type
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        date_key,
-                        existing[0] + agg["prompts"],
-                        existing[1] + agg["responses"],
-                        existing[2] + len(agg["sessions"]),
-                        existing[3] + agg["total_tokens"],
-                        existing[4] + agg["input_tokens"],
-                        existing[5] + agg["output_tokens"],
-                        existing[6] + agg["cache_creation_tokens"],
-                        existing[7] + agg["cache_read_tokens"],
-                        timestamp,
-                        device_id,
-                        device_name,
-                        device_type,
-                    ))
-                else:
-                    # New date, insert fresh
-                    cursor.execute("""
-                        INSERT INTO daily_snapshots (
-                            date, total_prompts, total_responses, total_sessions, total_tokens,
-                            input_tokens, output_tokens, cache_creation_tokens,
-                            cache_read_tokens, snapshot_timestamp,
-                            device_id, device_name, device_type
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        date_key,
-                        agg["prompts"],
-                        agg["responses"],
-                        len(agg["sessions"]),
-                        agg["total_tokens"],
-                        agg["input_tokens"],
-                        agg["output_tokens"],
-                        agg["cache_creation_tokens"],
-                        agg["cache_read_tokens"],
-                        timestamp,
-                        device_id,
-                        device_name,
-                        device_type,
-                    ))
-                saved_count += 1
+                )
+                for date_key, agg in daily_aggregates.items()
+            ])
+            saved_count += len(daily_aggregates)
 
-        conn.commit()
+        cursor.execute("COMMIT")
     finally:
         conn.close()
 
@@ -568,14 +854,17 @@ def save_file_aggregate(
     init_database(db_path)
     fresh = _aggregate_by_date(records)
 
-    conn = sqlite3.connect(str(db_path))
+    # Read-modify-write of the ledger and daily totals: hold the write lock
+    # from the first read so two hook processes can't apply the same delta
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
     try:
         cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
         cursor.execute(
             f"SELECT date, {', '.join(_CONTRIB_FIELDS)} FROM file_contributions WHERE file_path = ?",
             (str(file_path),),
         )
-        previous = {row[0]: dict(zip(_CONTRIB_FIELDS, row[1:])) for row in cursor.fetchall()}
+        previous = {date: dict(zip(_CONTRIB_FIELDS, values, strict=True)) for date, *values in cursor}
         if not previous:
             cursor.execute(
                 "SELECT 1 FROM file_metadata WHERE file_path = ?", (str(file_path),)
@@ -612,12 +901,25 @@ def save_file_aggregate(
                 total = merged[3] + merged[4] + merged[5] + merged[6]
                 cursor.execute(
                     """
-                    INSERT OR REPLACE INTO daily_snapshots (
+                    INSERT INTO daily_snapshots (
                         date, total_prompts, total_responses, total_sessions,
                         total_tokens, input_tokens, output_tokens,
                         cache_creation_tokens, cache_read_tokens,
                         snapshot_timestamp, device_id, device_name, device_type
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(date) DO UPDATE SET
+                        total_prompts = excluded.total_prompts,
+                        total_responses = excluded.total_responses,
+                        total_sessions = excluded.total_sessions,
+                        total_tokens = excluded.total_tokens,
+                        input_tokens = excluded.input_tokens,
+                        output_tokens = excluded.output_tokens,
+                        cache_creation_tokens = excluded.cache_creation_tokens,
+                        cache_read_tokens = excluded.cache_read_tokens,
+                        snapshot_timestamp = excluded.snapshot_timestamp,
+                        device_id = excluded.device_id,
+                        device_name = excluded.device_name,
+                        device_type = excluded.device_type
                     """,
                     (date, merged[0], merged[1], merged[2], total,
                      merged[3], merged[4], merged[5], merged[6],
@@ -633,7 +935,7 @@ def save_file_aggregate(
                 """,
                 tuple([str(file_path), date] + [day[field] for field in _CONTRIB_FIELDS]),
             )
-        conn.commit()
+        cursor.execute("COMMIT")
         return new_responses
     finally:
         conn.close()
@@ -670,8 +972,15 @@ def load_historical_records(
     try:
         cursor = conn.cursor()
 
-        # First try to load from usage_records (full mode)
-        query = "SELECT * FROM usage_records WHERE 1=1"
+        # First try to load from usage_records (full mode). Explicit column
+        # list in unpacking order, so schema additions can't shift indices.
+        query = """
+            SELECT timestamp, session_id, message_uuid, message_type,
+                   model, folder, git_branch, version,
+                   input_tokens, output_tokens,
+                   cache_creation_tokens, cache_read_tokens
+            FROM usage_records WHERE 1=1
+        """
         params = []
 
         if start_date:
@@ -686,36 +995,37 @@ def load_historical_records(
 
         cursor.execute(query, params)
 
+        # Stream rows off the cursor instead of materializing fetchall(),
+        # with the per-row callables bound to locals
+        fromisoformat = datetime.fromisoformat
         records = []
-        for row in cursor.fetchall():
-            # Parse the row into a UsageRecord
-            # Row columns: id, date, timestamp, session_id, message_uuid, message_type,
-            #              model, folder, git_branch, version,
-            #              input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens, total_tokens
-            from src.models.usage_record import TokenUsage
-
+        append = records.append
+        for (
+            timestamp, session_id, message_uuid, message_type,
+            model, folder, git_branch, version,
+            input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens,
+        ) in cursor:
             # Only create TokenUsage if tokens exist (assistant messages)
             token_usage = None
-            if row[10] > 0 or row[11] > 0:  # if input_tokens or output_tokens exist
+            if input_tokens > 0 or output_tokens > 0:
                 token_usage = TokenUsage(
-                    input_tokens=row[10],
-                    output_tokens=row[11],
-                    cache_creation_tokens=row[12],
-                    cache_read_tokens=row[13],
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    cache_creation_tokens=cache_creation_tokens,
+                    cache_read_tokens=cache_read_tokens,
                 )
 
-            record = UsageRecord(
-                timestamp=datetime.fromisoformat(row[2]),
-                session_id=row[3],
-                message_uuid=row[4],
-                message_type=row[5],
-                model=row[6],
-                folder=row[7],
-                git_branch=row[8],
-                version=row[9],
+            append(UsageRecord(
+                timestamp=fromisoformat(timestamp),
+                session_id=session_id,
+                message_uuid=message_uuid,
+                message_type=message_type,
+                model=model,
+                folder=folder,
+                git_branch=git_branch,
+                version=version,
                 token_usage=token_usage,
-            )
-            records.append(record)
+            ))
 
         # If no records from usage_records, try daily_snapshots (aggregate mode)
         if not records:
@@ -744,9 +1054,7 @@ def _load_from_daily_snapshots(
     Returns:
         List of synthetic UsageRecord objects (one per day)
     """
-    from src.models.usage_record import TokenUsage
-
-    query = "SELECT date, total_tokens, input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens, total_sessions FROM daily_snapshots WHERE 1=1"
+    query = "SELECT date, input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens FROM daily_snapshots WHERE 1=1"
     params = []
 
     if start_date:
@@ -762,8 +1070,7 @@ def _load_from_daily_snapshots(
     cursor.execute(query, params)
 
     records = []
-    for row in cursor.fetchall():
-        date_str, total_tokens, input_tokens, output_tokens, cache_creation, cache_read, sessions = row
+    for date_str, input_tokens, output_tokens, cache_creation, cache_read in cursor:
 
         # Create a synthetic UsageRecord for each day
         token_usage = TokenUsage(
@@ -798,13 +1105,7 @@ def get_text_analysis_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
     """
     from src.config.settings import get_claude_jsonl_files
     from src.data.jsonl_parser import parse_all_jsonl_files
-    from src.utils.text_analysis import (
-        count_absolutely_right_phrases,
-        count_perfect_phrases,
-        count_please_phrases,
-        count_swears,
-        count_thank_phrases,
-    )
+    from src.utils.text_analysis import scan_message
 
     try:
         # Get current JSONL files
@@ -838,15 +1139,17 @@ def get_text_analysis_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
                 continue
 
             if record.is_user_prompt:
-                user_swears += count_swears(record.content)
-                user_thanks += count_thank_phrases(record.content)
-                user_please += count_please_phrases(record.content)
+                counts = scan_message(record.content, ("swears", "thanks", "please"))
+                user_swears += counts["swears"]
+                user_thanks += counts["thanks"]
+                user_please += counts["please"]
                 total_user_chars += record.char_count
                 user_prompt_count += 1
             elif record.is_assistant_response:
-                assistant_swears += count_swears(record.content)
-                perfect_count += count_perfect_phrases(record.content)
-                absolutely_right_count += count_absolutely_right_phrases(record.content)
+                counts = scan_message(record.content, ("swears", "perfect", "absolutely_right"))
+                assistant_swears += counts["swears"]
+                perfect_count += counts["perfect"]
+                absolutely_right_count += counts["absolutely_right"]
 
         avg_user_prompt_chars = total_user_chars / user_prompt_count if user_prompt_count > 0 else 0
 
@@ -889,148 +1192,122 @@ def get_database_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
         - avg_tokens_per_session, avg_tokens_per_prompt
     """
     if not db_path.exists():
-        return {
-            "total_records": 0,
-            "total_days": 0,
-            "oldest_date": None,
-            "newest_date": None,
-            "newest_timestamp": None,
-            "total_tokens": 0,
-            "total_prompts": 0,
-            "total_responses": 0,
-            "total_sessions": 0,
-            "tokens_by_model": {},
-            "cost_by_model": {},
-            "total_cost": 0.0,
-            "avg_tokens_per_session": 0,
-            "avg_tokens_per_response": 0,
-            "avg_cost_per_session": 0.0,
-            "avg_cost_per_response": 0.0,
-        }
-
-    conn = sqlite3.connect(db_path)
-
-    try:
-        cursor = conn.cursor()
-
-        # Basic counts
-        cursor.execute("SELECT COUNT(*) FROM usage_records")
-        total_records = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(DISTINCT date) FROM usage_records")
-        total_days = cursor.fetchone()[0]
-
-        cursor.execute("SELECT MIN(date), MAX(date) FROM usage_records")
-        oldest_date, newest_date = cursor.fetchone()
-
-        # Get newest snapshot timestamp
-        cursor.execute("SELECT MAX(snapshot_timestamp) FROM daily_snapshots")
-        newest_timestamp = cursor.fetchone()[0]
-
-        # Aggregate statistics from daily_snapshots
-        cursor.execute("""
+        return _copy_stats(_EMPTY_STATS)
+
+    # Commits rewrite the main file (rollback journal), so an unchanged
+    # (inode, mtime, size) within the TTL means unchanged stats
+    st = db_path.stat()
+    file_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _STATS_CACHE.get(str(db_path))
+    if (
+        cached is not None
+        and cached[0] == file_key
+        and time.monotonic() - cached[1] < STATS_CACHE_TTL
+    ):
+        return _copy_stats(cached[2])
+
+    conn = _get_conn(db_path)
+    cursor = conn.cursor()
+
+    # Scalar stats in one statement: one pass over usage_records and one
+    # over daily_snapshots, with empty sums coalesced to 0 in SQL
+    cursor.execute("""
+        WITH rec AS (
+            SELECT COUNT(*), COUNT(DISTINCT date), MIN(date), MAX(date)
+            FROM usage_records
+        ),
+        snap AS (
             SELECT
-                SUM(total_tokens) as total_tokens,
-                SUM(total_prompts) as total_prompts,
-                SUM(total_responses) as total_responses,
-                SUM(total_sessions) as total_sessions
+                MAX(snapshot_timestamp),
+                COALESCE(SUM(total_tokens), 0),
+                COALESCE(SUM(total_prompts), 0),
+                COALESCE(SUM(total_responses), 0),
+                COALESCE(SUM(total_sessions), 0)
             FROM daily_snapshots
+        )
+        SELECT * FROM rec, snap
+    """)
+    (
+        total_records, total_days, oldest_date, newest_date, newest_timestamp,
+        total_tokens, total_prompts, total_responses, total_sessions,
+    ) = cursor.fetchone()
+
+    # Fresh install: no usage_records and no daily_snapshots. Aggregate mode
+    # has daily_snapshots without usage_records, so both must be empty.
+    if total_records == 0 and newest_timestamp is None:
+        stats = _copy_stats(_EMPTY_STATS)
+        _STATS_CACHE[str(db_path)] = (file_key, time.monotonic(), stats)
+        return _copy_stats(stats)
+
+    # Tokens by model (only available if usage_records exist) come out of
+    # the per-model cost query below instead of a separate GROUP BY
+    tokens_by_model = {}
+
+    # Calculate costs by joining with pricing table
+    total_cost = 0.0
+    cost_by_model = {}
+
+    if total_records > 0:
+        # Cost is folded in SQL; 1h cache writes bill at 2x base input (vs
+        # 1.25x for the 5m tier) when the pricing row has no explicit rate
+        cursor.execute("""
+            SELECT
+                ur.model,
+                SUM(ur.total_tokens) as tokens,
+                (
+                    SUM(ur.input_tokens) * COALESCE(mp.input_price_per_mtok, 0)
+                    + SUM(ur.output_tokens) * COALESCE(mp.output_price_per_mtok, 0)
+                    + (SUM(ur.cache_creation_tokens) - SUM(COALESCE(ur.cache_creation_1h_tokens, 0)))
+                        * COALESCE(mp.cache_write_price_per_mtok, 0)
+                    + SUM(COALESCE(ur.cache_creation_1h_tokens, 0)) * COALESCE(
+                        mp.cache_write_1h_price_per_mtok,
+                        COALESCE(mp.cache_write_price_per_mtok, 0) * 1.6
+                    )
+                    + SUM(ur.cache_read_tokens) * COALESCE(mp.cache_read_price_per_mtok, 0)
+                ) / 1000000.0 as cost
+            FROM usage_records ur
+            LEFT JOIN model_pricing mp ON ur.model = mp.model_name
+            WHERE ur.model IS NOT NULL
+            GROUP BY ur.model
         """)
-        row = cursor.fetchone()
-        total_tokens = row[0] or 0
-        total_prompts = row[1] or 0
-        total_responses = row[2] or 0
-        total_sessions = row[3] or 0
-
-        # Tokens by model (only available if usage_records exist)
-        tokens_by_model = {}
-        if total_records > 0:
-            cursor.execute("""
-                SELECT model, SUM(total_tokens) as tokens
-                FROM usage_records
-                GROUP BY model
-                ORDER BY tokens DESC
-            """)
-            tokens_by_model = {row[0]: row[1] for row in cursor.fetchall() if row[0]}
-
-        # Calculate costs by joining with pricing table
-        total_cost = 0.0
-        cost_by_model = {}
-
-        if total_records > 0:
-            cursor.execute("""
-                SELECT
-                    ur.model,
-                    SUM(ur.input_tokens) as total_input,
-                    SUM(ur.output_tokens) as total_output,
-                    SUM(ur.cache_creation_tokens) as total_cache_write,
-                    SUM(ur.cache_read_tokens) as total_cache_read,
-                    mp.input_price_per_mtok,
-                    mp.output_price_per_mtok,
-                    mp.cache_write_price_per_mtok,
-                    mp.cache_read_price_per_mtok,
-                    SUM(COALESCE(ur.cache_creation_1h_tokens, 0)) as total_cache_write_1h,
-                    mp.cache_write_1h_price_per_mtok
-                FROM usage_records ur
-                LEFT JOIN model_pricing mp ON ur.model = mp.model_name
-                WHERE ur.model IS NOT NULL
-                GROUP BY ur.model
-            """)
-
-            for row in cursor.fetchall():
-                model = row[0]
-                input_tokens = row[1] or 0
-                output_tokens = row[2] or 0
-                cache_write_tokens = row[3] or 0
-                cache_read_tokens = row[4] or 0
-                cache_write_1h_tokens = row[9] or 0
-
-                # Pricing per million tokens; 1h cache writes bill at 2x base
-                # input (vs 1.25x for the 5m tier)
-                input_price = row[5] or 0.0
-                output_price = row[6] or 0.0
-                cache_write_price = row[7] or 0.0
-                cache_read_price = row[8] or 0.0
-                cache_write_1h_price = row[10] if row[10] is not None else cache_write_price * 1.6
-
-                # Calculate cost in dollars
-                model_cost = (
-                    (input_tokens / 1_000_000) * input_price +
-                    (output_tokens / 1_000_000) * output_price +
-                    ((cache_write_tokens - cache_write_1h_tokens) / 1_000_000) * cache_write_price +
-                    (cache_write_1h_tokens / 1_000_000) * cache_write_1h_price +
-                    (cache_read_tokens / 1_000_000) * cache_read_price
-                )
 
-                cost_by_model[model] = model_cost
-                total_cost += model_cost
+        for model, tokens, model_cost in cursor:
+            if model:
+                tokens_by_model[model] = tokens
+            cost_by_model[model] = model_cost
+            total_cost += model_cost
 
-        # Calculate averages
-        avg_tokens_per_session = total_tokens / total_sessions if total_sessions > 0 else 0
-        avg_tokens_per_response = total_tokens / total_responses if total_responses > 0 else 0
-        avg_cost_per_session = total_cost / total_sessions if total_sessions > 0 else 0
-        avg_cost_per_response = total_cost / total_responses if total_responses > 0 else 0
+        # Largest consumers first
+        tokens_by_model = dict(
+            sorted(tokens_by_model.items(), key=lambda item: item[1], reverse=True)
+        )
 
-        return {
-            "total_records": total_records,
-            "total_days": total_days,
-            "oldest_date": oldest_date,
-            "newest_date": newest_date,
-            "newest_timestamp": newest_timestamp,
-            "total_tokens": total_tokens,
-            "total_prompts": total_prompts,
-            "total_responses": total_responses,
-            "total_sessions": total_sessions,
-            "tokens_by_model": tokens_by_model,
-            "cost_by_model": cost_by_model,
-            "total_cost": total_cost,
-            "avg_tokens_per_session": round(avg_tokens_per_session),
-            "avg_tokens_per_response": round(avg_tokens_per_response),
-            "avg_cost_per_session": round(avg_cost_per_session, 2),
-            "avg_cost_per_response": round(avg_cost_per_response, 4),
-        }
-    finally:
-        conn.close()
+    # Calculate averages
+    avg_tokens_per_session = total_tokens / total_sessions if total_sessions > 0 else 0
+    avg_tokens_per_response = total_tokens / total_responses if total_responses > 0 else 0
+    avg_cost_per_session = total_cost / total_sessions if total_sessions > 0 else 0
+    avg_cost_per_response = total_cost / total_responses if total_responses > 0 else 0
+
+    stats = {
+        "total_records": total_records,
+        "total_days": total_days,
+        "oldest_date": oldest_date,
+        "newest_date": newest_date,
+        "newest_timestamp": newest_timestamp,
+        "total_tokens": total_tokens,
+        "total_prompts": total_prompts,
+        "total_responses": total_responses,
+        "total_sessions": total_sessions,
+        "tokens_by_model": tokens_by_model,
+        "cost_by_model": cost_by_model,
+        "total_cost": total_cost,
+        "avg_tokens_per_session": round(avg_tokens_per_session),
+        "avg_tokens_per_response": round(avg_tokens_per_response),
+        "avg_cost_per_session": round(avg_cost_per_session, 2),
+        "avg_cost_per_response": round(avg_cost_per_response, 4),
+    }
+    _STATS_CACHE[str(db_path)] = (file_key, time.monotonic(), stats)
+    return _copy_stats(stats)
 
 
 def get_stale_files(
@@ -1040,7 +1317,8 @@ def get_stale_files(
     """
     Identify which JSONL files need to be re-parsed based on mtime/size changes.
 
-    Compares current file stats against stored metadata to find:
+    Stages current file stats in a temp table and diffs them against stored
+    metadata in SQL to find:
     - New files (not in database)
     - Modified files (mtime or size changed)
     - Deleted files (in database but not on disk)
@@ -1060,48 +1338,50 @@ def get_stale_files(
 
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path)
-    stale_files = []
-    deleted_files = []
-
-    try:
-        cursor = conn.cursor()
+    conn = _get_conn(db_path)
 
-        # Get all stored file metadata
-        cursor.execute("SELECT file_path, mtime_ns, size_bytes FROM file_metadata")
-        stored_metadata = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+    # Stage the current (path, mtime, size) set and diff it against
+    # file_metadata with two indexed joins. Files that fail to stat are
+    # staged with NULL stats: present (never deleted), but not stale either.
+    current_metadata = _scan_mtime_size(all_files)
+    with conn:
+        conn.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS current_files (
+                file_path TEXT PRIMARY KEY,
+                mtime_ns INTEGER,
+                size_bytes INTEGER
+            )
+        """)
+        conn.execute("DELETE FROM temp.current_files")
+        conn.executemany(
+            "INSERT OR IGNORE INTO temp.current_files VALUES (?, ?, ?)",
+            ((path_str, *current_metadata.get(path_str, (None, None)))
+             for path_str in map(str, all_files)),
+        )
 
-        # Convert current files to set of path strings for comparison
-        current_file_paths = {str(f) for f in all_files}
+        stale_paths = {row[0] for row in conn.execute("""
+            SELECT c.file_path
+            FROM temp.current_files c
+            LEFT JOIN file_metadata f ON f.file_path = c.file_path
+            WHERE c.mtime_ns IS NOT NULL
+              AND (
+                  f.file_path IS NULL
+                  OR f.mtime_ns <> c.mtime_ns
+                  OR f.size_bytes <> c.size_bytes
+              )
+        """)}
+        deleted_files = [row[0] for row in conn.execute("""
+            SELECT f.file_path
+            FROM file_metadata f
+            WHERE NOT EXISTS (
+                SELECT 1 FROM temp.current_files c WHERE c.file_path = f.file_path
+            )
+        """)]
+        conn.execute("DELETE FROM temp.current_files")
 
-        # Check each current file
-        for file_path in all_files:
-            path_str = str(file_path)
-            try:
-                stat = file_path.stat()
-                current_mtime_ns = stat.st_mtime_ns
-                current_size = stat.st_size
-
-                if path_str not in stored_metadata:
-                    # New file
-                    stale_files.append(file_path)
-                else:
-                    stored_mtime_ns, stored_size = stored_metadata[path_str]
-                    if current_mtime_ns != stored_mtime_ns or current_size != stored_size:
-                        # Modified file
-                        stale_files.append(file_path)
-            except OSError:
-                # File inaccessible, skip
-                continue
+    stale_files = [f for f in all_files if str(f) in stale_paths]
 
-        # Find deleted files (in DB but not on disk)
-        for stored_path in stored_metadata.keys():
-            if stored_path not in current_file_paths:
-                deleted_files.append(stored_path)
-
-        return (stale_files, deleted_files)
-    finally:
-        conn.close()
+    return (stale_files, deleted_files)
 
 
 def update_files_metadata(
@@ -1142,16 +1422,14 @@ def update_files_metadata(
     if not rows:
         return
 
-    conn = sqlite3.connect(db_path)
-    try:
+    # Connection context manager commits, or rolls back on error, without
+    # closing the cached connection
+    with _get_conn(db_path) as conn:
         conn.executemany("""
             INSERT OR REPLACE INTO file_metadata (
                 file_path, mtime_ns, size_bytes, record_count, last_parsed
             ) VALUES (?, ?, ?, ?, ?)
         """, rows)
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def remove_deleted_file_metadata(
@@ -1171,17 +1449,15 @@ def remove_deleted_file_metadata(
     if not db_path.exists():
         return
 
-    conn = sqlite3.connect(db_path)
-
-    try:
-        cursor = conn.cursor()
-
-        for path in deleted_paths:
-            cursor.execute("DELETE FROM file_metadata WHERE file_path = ?", (path,))
-
-        conn.commit()
-    finally:
-        conn.close()
+    # One transaction, one DELETE per PATH_PARAM_CHUNK paths
+    with _get_conn(db_path) as conn:
+        for i in range(0, len(deleted_paths), PATH_PARAM_CHUNK):
+            path_chunk = deleted_paths[i:i + PATH_PARAM_CHUNK]
+            placeholders = ",".join("?" * len(path_chunk))
+            conn.execute(
+                f"DELETE FROM file_metadata WHERE file_path IN ({placeholders})",
+                path_chunk,
+            )
 
 
 def get_update_coverage(db_path: Path = DEFAULT_DB_PATH) -> dict:
@@ -1197,14 +1473,10 @@ def get_update_coverage(db_path: Path = DEFAULT_DB_PATH) -> dict:
     if not db_path.exists():
         return {"total_records": 0, "oldest_date": None, "newest_date": None}
 
-    conn = sqlite3.connect(db_path)
-    try:
-        row = conn.execute(
-            "SELECT COUNT(*), MIN(date), MAX(date) FROM usage_records"
-        ).fetchone()
-        return {"total_records": row[0] or 0, "oldest_date": row[1], "newest_date": row[2]}
-    finally:
-        conn.close()
+    total_records, oldest_date, newest_date = _get_conn(db_path).execute(
+        "SELECT COUNT(*), MIN(date), MAX(date) FROM usage_records"
+    ).fetchone()
+    return {"total_records": total_records, "oldest_date": oldest_date, "newest_date": newest_date}
 
 
 def get_file_metadata_count(db_path: Path = DEFAULT_DB_PATH) -> int:
@@ -1220,17 +1492,13 @@ def get_file_metadata_count(db_path: Path = DEFAULT_DB_PATH) -> int:
     if not db_path.exists():
         return 0
 
-    conn = sqlite3.connect(db_path)
-
     try:
-        cursor = conn.cursor()
+        cursor = _get_conn(db_path).cursor()
         cursor.execute("SELECT COUNT(*) FROM file_metadata")
         return cursor.fetchone()[0]
     except sqlite3.OperationalError:
         # Table doesn't exist yet
         return 0
-    finally:
-        conn.close()
 
 
 def fill_empty_daily_snapshots(
@@ -1241,36 +1509,49 @@ def fill_empty_daily_snapshots(
     """
     Insert zero-usage daily_snapshots rows for any date in [start_date, end_date]
     that does not already have a row. Returns the number of rows inserted.
+
+    Args:
+        start_date: Inclusive start date (YYYY-MM-DD)
+        end_date: Inclusive end date (YYYY-MM-DD)
+        db_path: Path to the SQLite database file
+
+    Raises:
+        ValueError: If either bound is not a YYYY-MM-DD date
     """
-    from datetime import datetime as _dt
-    from datetime import timedelta as _td
+    # SQLite's date() turns a malformed bound into NULL and the CTE would
+    # quietly yield no days; parse both up front and pass the normalized form
+    start_date = date.fromisoformat(start_date).isoformat()
+    end_date = date.fromisoformat(end_date).isoformat()
 
     init_database(db_path)
     conn = sqlite3.connect(db_path)
     try:
         cursor = conn.cursor()
-        cursor.execute("SELECT date FROM daily_snapshots")
-        existing = {row[0] for row in cursor.fetchall()}
-
-        current = _dt.strptime(start_date, "%Y-%m-%d").date()
-        last = _dt.strptime(end_date, "%Y-%m-%d").date()
-        timestamp = _dt.now().isoformat()
-        inserted = 0
-        while current <= last:
-            date_str = current.strftime("%Y-%m-%d")
-            if date_str not in existing:
-                cursor.execute(
-                    """
-                    INSERT OR IGNORE INTO daily_snapshots (
-                        date, total_prompts, total_responses, total_sessions, total_tokens,
-                        input_tokens, output_tokens, cache_creation_tokens,
-                        cache_read_tokens, snapshot_timestamp
-                    ) VALUES (?, 0, 0, 0, 0, 0, 0, 0, 0, ?)
-                    """,
-                    (date_str, timestamp),
-                )
-                inserted += 1
-            current += _td(days=1)
+        # Generate the calendar in SQL and anti-join it against the existing
+        # rows, instead of pulling every stored date into Python and walking
+        # the range with strftime per day
+        changes_before = conn.total_changes
+        cursor.execute(
+            """
+            WITH RECURSIVE days(date) AS (
+                SELECT date(?1) WHERE date(?1) <= date(?2)
+                UNION ALL
+                SELECT date(date, '+1 day') FROM days WHERE date < date(?2)
+            )
+            INSERT OR IGNORE INTO daily_snapshots (
+                date, total_prompts, total_responses, total_sessions, total_tokens,
+                input_tokens, output_tokens, cache_creation_tokens,
+                cache_read_tokens, snapshot_timestamp
+            )
+            SELECT days.date, 0, 0, 0, 0, 0, 0, 0, 0, ?3
+            FROM days
+            WHERE NOT EXISTS (
+                SELECT 1 FROM daily_snapshots s WHERE s.date = days.date
+            )
+            """,
+            (start_date, end_date, datetime.now().isoformat()),
+        )
+        inserted = conn.total_changes - changes_before
         conn.commit()
         return inserted
     finally:
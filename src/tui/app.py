@@ -7,15 +7,19 @@ and managing Claude Code utilities.
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+import functools
+from datetime import date, datetime
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
 try:
+    from textual import work
     from textual.app import App, ComposeResult
     from textual.binding import Binding
     from textual.containers import Container, Horizontal, ScrollableContainer, Vertical
     from textual.reactive import reactive
     from textual.widgets import Button, DataTable, Footer, Header, Label, ProgressBar, Static
+    from textual.worker import get_current_worker
 
     TEXTUAL_AVAILABLE = True
 except ImportError:
@@ -31,6 +35,12 @@ EMBER = "#ff6600"
 SAGE = "#88aa77"
 SLATE = "#667788"
 
+# Heat level byte (0-4) -> heatmap glyph, for bytes.translate
+HEAT_TABLE = bytes.maketrans(bytes(range(5)), b".:*#@")
+
+# Seconds to wait for further refresh key presses before reloading
+REFRESH_DEBOUNCE = 0.1
+
 
 CSS = """
 Screen {
@@ -143,6 +153,8 @@ Screen {
 """
 
 
+# typed: the stats averages are floats, and 500.0 must not reuse "500"
+@functools.lru_cache(maxsize=512, typed=True)
 def _fmt(num: int) -> str:
     """Format number with K/M/B suffix."""
     if num >= 1_000_000_000:
@@ -154,6 +166,18 @@ def _fmt(num: int) -> str:
     return str(num)
 
 
+def _daily_tokens(records: list) -> dict[str, int]:
+    """Sum total tokens per local-day date_key, skipping records without usage."""
+    daily: dict[str, int] = {}
+    get = daily.get
+    for record in records:
+        usage = record.token_usage
+        if usage:
+            key = record.date_key
+            daily[key] = get(key, 0) + usage.total_tokens
+    return daily
+
+
 # Only define Textual widgets if textual is available
 if TEXTUAL_AVAILABLE:
     class KPICard(Static):
@@ -164,16 +188,20 @@ if TEXTUAL_AVAILABLE:
             self.label = label
             self._value_text = value
             self._label_text = label
+            self._value_label: Label | None = None
 
         def compose(self) -> ComposeResult:
-            yield Label(self._value_text, classes="kpi-value", id="value-label")
+            self._value_label = Label(self._value_text, classes="kpi-value", id="value-label")
+            yield self._value_label
             yield Label(self._label_text, classes="kpi-label")
 
         def update_value(self, new_value: str) -> None:
             """Update the displayed value."""
             self._value_text = new_value
+            if self._value_label is None:
+                return
             try:
-                self.query_one("#value-label", Label).update(new_value)
+                self._value_label.update(new_value)
             except Exception:
                 pass
 
@@ -196,6 +224,23 @@ if TEXTUAL_AVAILABLE:
             super().__init__()
             self.stats: dict = {}
             self.records: list = []
+            self.daily_tokens: dict[str, int] = {}
+            # (today, 13 weeks x 7 date_keys) for the heatmap; rebuilt when
+            # the date rolls over
+            self._heatmap_grid: tuple[date, list[list[str]]] | None = None
+            # (today, daily_tokens it was built from, text): reused until the
+            # date rolls over or a reload swaps in a new daily_tokens dict
+            self._heatmap_text: tuple[date, dict[str, int], str] | None = None
+            # Section name -> inputs it was last rendered from
+            self._rendered: dict[str, object] = {}
+            self._refresh_timer = None
+            # Model keys in the order their rows sit in the model table
+            self._model_rows: list[str] = []
+            # Widget handles looked up once in on_mount
+            self._widgets: dict[str, Any] = {}
+            # (st_mtime_ns, st_size) of the DB that stats/records were read
+            # from; refresh skips the full reload while it still matches
+            self._data_key: tuple[int, int] | None = None
 
         def compose(self) -> ComposeResult:
             yield Header()
@@ -223,15 +268,69 @@ if TEXTUAL_AVAILABLE:
 
         def on_mount(self) -> None:
             """Load data when app starts."""
+            self._widgets = {
+                "tokens": self.query_one("#kpi-tokens", KPICard),
+                "prompts": self.query_one("#kpi-prompts", KPICard),
+                "sessions": self.query_one("#kpi-sessions", KPICard),
+                "days": self.query_one("#kpi-days", KPICard),
+                "activity": self.query_one("#activity-content", Static),
+                "models": self.query_one("#model-table", DataTable),
+                "stats": self.query_one("#stats-content", Static),
+            }
+            table = self._widgets["models"]
+            table.add_column("Model", key="model")
+            table.add_column("Tokens", key="tokens")
+            table.add_column("%", key="pct")
             self.load_data()
 
-        def load_data(self) -> None:
-            """Load usage data from database."""
+        def load_data(self, announce: bool = False) -> None:
+            """
+            Load usage data from database without blocking the UI.
+
+            Args:
+                announce: Notify "Data refreshed" once the widgets update
+            """
+            from src.storage.snapshot_db import DEFAULT_DB_PATH
+
+            # Stat before reading so a write landing mid-load leaves a
+            # stale key and the next refresh picks it up.
+            try:
+                st = DEFAULT_DB_PATH.stat()
+                key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = None
+
+            # Unchanged database: no worker, no queries. The widgets still
+            # get a pass so the heatmap follows a date rollover.
+            if key is not None and key == self._data_key:
+                self._apply_data(key, None, announce)
+                return
+            self._load_worker(key, announce)
+
+        @work(thread=True, exclusive=True, group="load")
+        def _load_worker(self, key: tuple[int, int] | None, announce: bool) -> None:
+            """Read stats/records off the event loop, then hand them back to it."""
             try:
                 from src.storage.snapshot_db import get_database_stats, load_historical_records
 
-                self.stats = get_database_stats()
-                self.records = load_historical_records()
+                records = load_historical_records()
+                data = (get_database_stats(), records, _daily_tokens(records))
+            except Exception as e:
+                self.call_from_thread(self.notify, f"Error loading data: {e}", severity="error")
+                return
+
+            # A newer load superseded this one (exclusive=True); let it apply.
+            if not get_current_worker().is_cancelled:
+                self.call_from_thread(self._apply_data, key, data, announce)
+
+        def _apply_data(
+            self, key: tuple[int, int] | None, data: tuple | None, announce: bool
+        ) -> None:
+            """Store freshly loaded data (None: unchanged) and update widgets."""
+            try:
+                if data is not None:
+                    self.stats, self.records, self.daily_tokens = data
+                    self._data_key = key
 
                 self.update_kpis()
                 self.update_activity()
@@ -240,6 +339,23 @@ if TEXTUAL_AVAILABLE:
 
             except Exception as e:
                 self.notify(f"Error loading data: {e}", severity="error")
+                return
+
+            if announce:
+                self.notify("Data refreshed", severity="information")
+
+        def _changed(self, section: str, inputs: object) -> bool:
+            """
+            Record the inputs a section is about to render from.
+
+            Returns:
+                False when they match the section's last render, so the
+                widget update can be skipped
+            """
+            if section in self._rendered and self._rendered[section] == inputs:
+                return False
+            self._rendered[section] = inputs
+            return True
 
         def update_kpis(self) -> None:
             """Update KPI cards with current data."""
@@ -247,34 +363,38 @@ if TEXTUAL_AVAILABLE:
             prompts = self.stats.get("total_prompts", 0)
             sessions = self.stats.get("total_sessions", 0)
             days = self.stats.get("total_days", 0)
+            if not self._changed("kpis", (tokens, prompts, sessions, days)):
+                return
 
-            self.query_one("#kpi-tokens", KPICard).update_value(_fmt(tokens))
-            self.query_one("#kpi-prompts", KPICard).update_value(str(prompts))
-            self.query_one("#kpi-sessions", KPICard).update_value(str(sessions))
-            self.query_one("#kpi-days", KPICard).update_value(str(days))
+            widgets = self._widgets
+            widgets["tokens"].update_value(_fmt(tokens))
+            widgets["prompts"].update_value(str(prompts))
+            widgets["sessions"].update_value(str(sessions))
+            widgets["days"].update_value(str(days))
 
         def update_activity(self) -> None:
             """Update activity heatmap."""
-            content = self.query_one("#activity-content", Static)
+            text = self._activity_text()
+            if self._changed("activity", text):
+                self._widgets["activity"].update(text)
 
+        def _activity_text(self) -> str:
+            """Render the activity heatmap text for the current data and date."""
             if not self.records:
-                content.update("No activity data available")
-                return
+                return "No activity data available"
 
             # Build simple text-based heatmap
-            from collections import defaultdict
             from datetime import timedelta
 
-            daily_tokens: dict[str, int] = defaultdict(int)
-            for record in self.records:
-                if record.token_usage:
-                    daily_tokens[record.date_key] += record.token_usage.total_tokens
-
+            daily_tokens = self.daily_tokens
             if not daily_tokens:
-                content.update("No token data available")
-                return
+                return "No token data available"
 
             today = datetime.now().date()
+            cached = self._heatmap_text
+            if cached is not None and cached[0] == today and cached[1] is daily_tokens:
+                return cached[2]
+
             max_tokens = max(daily_tokens.values())
 
             # Build last 12 weeks
@@ -282,72 +402,98 @@ if TEXTUAL_AVAILABLE:
             lines.append("Activity Heatmap (last 12 weeks)")
             lines.append("")
 
-            heat_chars = [".", ":", "*", "#", "@"]
-
-            for week_offset in range(12, -1, -1):
-                week_start = today - timedelta(days=today.weekday() + 7 * week_offset)
-                week_line = ""
-                for day in range(7):
-                    date = week_start + timedelta(days=day)
-                    date_key = date.strftime("%Y-%m-%d")
+            grid = self._heatmap_grid
+            if grid is None or grid[0] != today:
+                start = today - timedelta(days=today.weekday() + 7 * 12)
+                weeks = [
+                    [(start + timedelta(days=7 * week + day)).isoformat() for day in range(7)]
+                    for week in range(13)
+                ]
+                grid = self._heatmap_grid = (today, weeks)
+
+            levels = bytearray()
+            for week in grid[1]:
+                for date_key in week:
                     tokens = daily_tokens.get(date_key, 0)
-
                     if tokens == 0:
-                        week_line += "."
+                        levels.append(0)
                     else:
                         ratio = (tokens / max_tokens) ** 0.5
-                        level = min(4, int(ratio * 5))
-                        week_line += heat_chars[level]
+                        levels.append(min(4, int(ratio * 5)))
 
-                lines.append(week_line)
+            cells = levels.translate(HEAT_TABLE).decode("ascii")
+            lines.extend(cells[i:i + 7] for i in range(0, len(cells), 7))
 
             lines.append("")
             lines.append("Legend: . (none) : * # @ (most)")
 
-            content.update("\n".join(lines))
+            text = "\n".join(lines)
+            self._heatmap_text = (today, daily_tokens, text)
+            return text
 
         def update_models(self) -> None:
             """Update model breakdown table."""
-            table = self.query_one("#model-table", DataTable)
-            table.clear(columns=True)
-            table.add_columns("Model", "Tokens", "%")
-
             tokens_by_model = self.stats.get("tokens_by_model", {})
+            if not self._changed("models", tuple(tokens_by_model.items())):
+                return
+
+            table = self._widgets["models"]
             total = sum(tokens_by_model.values())
 
-            for model, tokens in sorted(tokens_by_model.items(), key=lambda x: -x[1]):
-                name = model.replace("claude-", "").split("-20")[0]
+            rows = []
+            for model, tokens in sorted(tokens_by_model.items(), key=itemgetter(1), reverse=True):
                 pct = (tokens / total * 100) if total > 0 else 0
-                table.add_row(name, _fmt(tokens), f"{pct:.1f}%")
+                rows.append((model, _fmt(tokens), f"{pct:.1f}%"))
+
+            # Same models in the same order: rewrite the changed cells in
+            # place. Otherwise rebuild the rows (columns are set up once).
+            order = [model for model, _, _ in rows]
+            if order == self._model_rows:
+                for model, tokens_text, pct_text in rows:
+                    table.update_cell(model, "tokens", tokens_text, update_width=True)
+                    table.update_cell(model, "pct", pct_text, update_width=True)
+                return
+
+            table.clear()
+            for model, tokens_text, pct_text in rows:
+                name = model.replace("claude-", "").split("-20")[0]
+                table.add_row(name, tokens_text, pct_text, key=model)
+            self._model_rows = order
 
         def update_stats(self) -> None:
             """Update stats panel."""
-            content = self.query_one("#stats-content", Static)
+            total_cost = self.stats.get("total_cost", 0)
+            avg_per_session = self.stats.get("avg_tokens_per_session", 0)
+            avg_per_response = self.stats.get("avg_tokens_per_response", 0)
+            oldest = self.stats.get("oldest_date", "N/A")
+            newest = self.stats.get("newest_date", "N/A")
+            inputs = (total_cost, avg_per_session, avg_per_response, oldest, newest)
+            if not self._changed("stats", inputs):
+                return
 
             lines = []
             lines.append("Statistics")
             lines.append("")
 
-            total_cost = self.stats.get("total_cost", 0)
-            avg_per_session = self.stats.get("avg_tokens_per_session", 0)
-            avg_per_response = self.stats.get("avg_tokens_per_response", 0)
-
             lines.append(f"API Cost Equivalent: ${total_cost:.2f}")
             lines.append(f"Avg Tokens/Session: {_fmt(avg_per_session)}")
             lines.append(f"Avg Tokens/Response: {_fmt(avg_per_response)}")
             lines.append("")
-
-            oldest = self.stats.get("oldest_date", "N/A")
-            newest = self.stats.get("newest_date", "N/A")
             lines.append(f"Date Range: {oldest} to {newest}")
 
-            content.update("\n".join(lines))
+            self._widgets["stats"].update("\n".join(lines))
 
         def action_refresh(self) -> None:
-            """Refresh data."""
-            self.notify("Refreshing data...")
-            self.load_data()
-            self.notify("Data refreshed", severity="information")
+            """Refresh data, collapsing rapid repeat presses into one reload."""
+            if self._refresh_timer is not None:
+                self._refresh_timer.stop()
+            else:
+                self.notify("Refreshing data...")
+            self._refresh_timer = self.set_timer(REFRESH_DEBOUNCE, self._do_refresh)
+
+        def _do_refresh(self) -> None:
+            self._refresh_timer = None
+            self.load_data(announce=True)
 
         def action_dashboard(self) -> None:
             """Show dashboard view."""
@@ -1,14 +1,32 @@
 #region Imports
+import functools
+import os
 import platform
-import re
+import string
 import subprocess
+import sys
 from pathlib import Path
 
 #endregion
 
 #region Constants
-# Valid sound name pattern: alphanumeric, spaces, hyphens, underscores only
-VALID_SOUND_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9\s_-]+$')
+# Valid sound name characters: ASCII alphanumeric, space, hyphen, underscore.
+# A set test rather than a regex: `$` would also accept a trailing newline.
+VALID_SOUND_NAME_CHARS = frozenset(string.ascii_letters + string.digits + " _-")
+
+# Map sound names to Windows Media files
+WINDOWS_SOUNDS = {
+    "Windows Notify": "Windows Notify System Generic.wav",
+    "Windows Ding": "Windows Ding.wav",
+    "chimes": "chimes.wav",
+    "chord": "chord.wav",
+    "notify": "notify.wav",
+    "tada": "tada.wav",
+    "Windows Background": "Windows Background.wav",
+}
+
+# Host OS, resolved once at import
+_SYSTEM = platform.system()
 #endregion
 
 
@@ -19,21 +37,27 @@ def open_file(file_path: Path) -> None:
     """
     Open a file with the default application (cross-platform).
 
+    Returns as soon as the opener is launched; it is not waited on.
+
     Args:
         file_path: Path to the file to open
     """
-    system = platform.system()
     try:
-        if system == "Darwin":  # macOS
-            subprocess.run(["open", str(file_path)], check=False)
-        elif system == "Windows":
-            subprocess.run(["start", str(file_path)], shell=True, check=False)
-        else:  # Linux and others
-            subprocess.run(["xdg-open", str(file_path)], check=False)
+        if sys.platform == "win32":
+            # Shell association lookup without spawning cmd.exe for `start`
+            os.startfile(str(file_path))
+        else:
+            opener = "open" if _SYSTEM == "Darwin" else "xdg-open"  # macOS / Linux and others
+            subprocess.Popen(
+                [opener, str(file_path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
     except Exception:
         pass  # Silently fail if opening doesn't work
 
 
+@functools.lru_cache(maxsize=32)
 def get_sound_command(sound_name: str) -> str | None:
     """
     Get the command to play a sound (cross-platform).
@@ -47,34 +71,24 @@ def get_sound_command(sound_name: str) -> str | None:
         - Sound name contains invalid characters (security)
         - Platform is not supported
         - Sound file does not exist (Windows only)
+
+    Results are cached per sound name for the life of the process.
     """
     # Security: Validate sound name to prevent command injection
-    if not sound_name or not VALID_SOUND_NAME_PATTERN.match(sound_name):
+    if not sound_name or not VALID_SOUND_NAME_CHARS.issuperset(sound_name):
         return None
 
-    system = platform.system()
-
-    if system == "Darwin":  # macOS
+    if _SYSTEM == "Darwin":  # macOS
         sound_path = Path(f"/System/Library/Sounds/{sound_name}.aiff")
         if not sound_path.exists():
             return None
         return f"afplay /System/Library/Sounds/{sound_name}.aiff &"
 
-    elif system == "Windows":
-        # Map sound names to Windows Media files
-        windows_sounds = {
-            "Windows Notify": "Windows Notify System Generic.wav",
-            "Windows Ding": "Windows Ding.wav",
-            "chimes": "chimes.wav",
-            "chord": "chord.wav",
-            "notify": "notify.wav",
-            "tada": "tada.wav",
-            "Windows Background": "Windows Background.wav",
-        }
+    elif _SYSTEM == "Windows":
         # Only allow mapped sound names on Windows (no arbitrary file access)
-        if sound_name not in windows_sounds:
+        sound_file = WINDOWS_SOUNDS.get(sound_name)
+        if sound_file is None:
             return None
-        sound_file = windows_sounds[sound_name]
 
         # Validate sound file exists
         sound_path = Path(f"C:\\Windows\\Media\\{sound_file}")
@@ -70,12 +70,54 @@ PLEASE_PATTERNS = [
     r'\bpls\b',
 ]
 
+# Compiled once per category. Categories keep one regex per pattern (not a
+# single alternation) because patterns overlap and every pattern's matches
+# count, e.g. "fuck" is counted by two F-word patterns.
+_COMPILED_PATTERNS = {
+    "swears": tuple(re.compile(p) for p in SWEAR_PATTERNS),
+    "perfect": tuple(re.compile(p) for p in PERFECT_PATTERNS),
+    "absolutely_right": tuple(re.compile(p) for p in ABSOLUTELY_RIGHT_PATTERNS),
+    "thanks": tuple(re.compile(p) for p in THANK_PATTERNS),
+    "please": tuple(re.compile(p) for p in PLEASE_PATTERNS),
+}
+
 #endregion
 
 
 #region Functions
 
 
+def _count_matches(patterns: tuple[re.Pattern, ...], text_lower: str) -> int:
+    """Total matches of every pattern in already-lowercased text."""
+    return sum(len(pattern.findall(text_lower)) for pattern in patterns)
+
+
+def scan_message(text: str | None, categories: tuple[str, ...]) -> dict[str, int]:
+    """
+    Count several phrase categories in one message.
+
+    Lowercases the text once and runs the precompiled patterns of each
+    requested category, instead of one count_* call (and one lower())
+    per category.
+
+    Args:
+        text: Text to analyze
+        categories: Keys of _COMPILED_PATTERNS ("swears", "perfect",
+            "absolutely_right", "thanks", "please")
+
+    Returns:
+        Dict of category -> match count (same counts as the count_* functions)
+    """
+    if not text:
+        return dict.fromkeys(categories, 0)
+
+    text_lower = text.lower()
+    return {
+        category: _count_matches(_COMPILED_PATTERNS[category], text_lower)
+        for category in categories
+    }
+
+
 def count_swears(text: str | None) -> int:
     """
     Count swear words in text using comprehensive pattern matching.
@@ -92,14 +134,7 @@ def count_swears(text: str | None) -> int:
     if not text:
         return 0
 
-    text_lower = text.lower()
-    count = 0
-
-    for pattern in SWEAR_PATTERNS:
-        matches = re.findall(pattern, text_lower)
-        count += len(matches)
-
-    return count
+    return _count_matches(_COMPILED_PATTERNS["swears"], text.lower())
 
 
 def count_perfect_phrases(text: str | None) -> int:
@@ -115,14 +150,7 @@ def count_perfect_phrases(text: str | None) -> int:
     if not text:
         return 0
 
-    text_lower = text.lower()
-    count = 0
-
-    for pattern in PERFECT_PATTERNS:
-        matches = re.findall(pattern, text_lower)
-        count += len(matches)
-
-    return count
+    return _count_matches(_COMPILED_PATTERNS["perfect"], text.lower())
 
 
 def count_absolutely_right_phrases(text: str | None) -> int:
@@ -138,14 +166,7 @@ def count_absolutely_right_phrases(text: str | None) -> int:
     if not text:
         return 0
 
-    text_lower = text.lower()
-    count = 0
-
-    for pattern in ABSOLUTELY_RIGHT_PATTERNS:
-        matches = re.findall(pattern, text_lower)
-        count += len(matches)
-
-    return count
+    return _count_matches(_COMPILED_PATTERNS["absolutely_right"], text.lower())
 
 
 def count_thank_phrases(text: str | None) -> int:
@@ -161,14 +182,7 @@ def count_thank_phrases(text: str | None) -> int:
     if not text:
         return 0
 
-    text_lower = text.lower()
-    count = 0
-
-    for pattern in THANK_PATTERNS:
-        matches = re.findall(pattern, text_lower)
-        count += len(matches)
-
-    return count
+    return _count_matches(_COMPILED_PATTERNS["thanks"], text.lower())
 
 
 def count_please_phrases(text: str | None) -> int:
@@ -184,14 +198,7 @@ def count_please_phrases(text: str | None) -> int:
     if not text:
         return 0
 
-    text_lower = text.lower()
-    count = 0
-
-    for pattern in PLEASE_PATTERNS:
-        matches = re.findall(pattern, text_lower)
-        count += len(matches)
-
-    return count
+    return _count_matches(_COMPILED_PATTERNS["please"], text.lower())
 
 
 def get_character_count(text: str | None) -> int:
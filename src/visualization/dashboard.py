@@ -1,5 +1,4 @@
 #region Imports
-from collections import defaultdict
 from datetime import datetime
 
 from rich.console import Console, Group
@@ -69,6 +68,34 @@ def _create_bar(value: int, max_value: int, width: int = BAR_WIDTH, color: str =
     return bar
 
 
+def _aggregate_breakdowns(records: list[UsageRecord]) -> tuple[dict[str, int], dict[str, int]]:
+    """
+    Sum total tokens per model and per project folder in one pass.
+
+    Args:
+        records: List of usage records
+
+    Returns:
+        Tuple of (model_tokens, folder_tokens). Synthetic and model-less
+        records count toward their folder but not toward any model.
+    """
+    model_tokens: dict[str, int] = {}
+    folder_tokens: dict[str, int] = {}
+
+    for record in records:
+        token_usage = record.token_usage
+        if not token_usage:
+            continue
+        tokens = token_usage.total_tokens
+        folder = record.folder
+        folder_tokens[folder] = folder_tokens.get(folder, 0) + tokens
+        model = record.model
+        if model and model != "<synthetic>":
+            model_tokens[model] = model_tokens.get(model, 0) + tokens
+
+    return model_tokens, folder_tokens
+
+
 def render_dashboard(stats: AggregatedStats, records: list[UsageRecord], console: Console, clear_screen: bool = True, date_range: str = None, fast_mode: bool = False) -> None:
     """
     Render a concise, modern dashboard with KPI cards and breakdowns.
@@ -84,38 +111,38 @@ def render_dashboard(stats: AggregatedStats, records: list[UsageRecord], console
     if clear_screen:
         console.clear()
 
+    # One pass over records feeds both breakdowns
+    model_tokens, folder_tokens = _aggregate_breakdowns(records)
+
     # Use simple text layout for narrow terminals (< 90 cols)
     if console.width < 90:
-        _render_simple_dashboard(stats, records, console, date_range, fast_mode)
+        _render_simple_dashboard(stats, model_tokens, folder_tokens, console, date_range, fast_mode)
         return
 
     # Create KPI cards
     kpi_section = _create_kpi_section(stats.overall_totals)
 
     # Create breakdowns
-    model_breakdown = _create_model_breakdown(records)
-    project_breakdown = _create_project_breakdown(records)
+    model_breakdown = _create_model_breakdown(model_tokens)
+    project_breakdown = _create_project_breakdown(folder_tokens)
 
     # Create footer with export info and date range
     footer = _create_footer(date_range, fast_mode=fast_mode)
 
-    # Render all components
-    console.print(kpi_section, end="")
-    console.print()  # Blank line between sections
-    console.print(model_breakdown, end="")
-    console.print()  # Blank line between sections
-    console.print(project_breakdown, end="")
-    console.print()  # Blank line before footer
-    console.print(footer)
+    # Render all components in one print (one layout/render pass), with a
+    # blank line between sections
+    blank = Text()
+    console.print(Group(kpi_section, blank, model_breakdown, blank, project_breakdown, blank, footer))
 
 
-def _render_simple_dashboard(stats: AggregatedStats, records: list[UsageRecord], console: Console, date_range: str = None, fast_mode: bool = False) -> None:
+def _render_simple_dashboard(stats: AggregatedStats, model_tokens: dict[str, int], folder_tokens: dict[str, int], console: Console, date_range: str = None, fast_mode: bool = False) -> None:
     """
     Render a simple text-based dashboard for narrow terminals.
 
     Args:
         stats: Aggregated statistics
-        records: Raw usage records
+        model_tokens: Total tokens per model
+        folder_tokens: Total tokens per project folder
         console: Rich console
         date_range: Optional date range
         fast_mode: If True, show fast mode warning
@@ -132,11 +159,6 @@ def _render_simple_dashboard(stats: AggregatedStats, records: list[UsageRecord],
     console.print()
 
     # Model breakdown
-    model_tokens: dict[str, int] = {}
-    for record in records:
-        if record.model and record.token_usage and record.model != "<synthetic>":
-            model_tokens[record.model] = model_tokens.get(record.model, 0) + record.token_usage.total_tokens
-
     if model_tokens:
         console.print("[bold]Models:[/bold]")
         total = sum(model_tokens.values())
@@ -147,11 +169,6 @@ def _render_simple_dashboard(stats: AggregatedStats, records: list[UsageRecord],
         console.print()
 
     # Project breakdown
-    folder_tokens: dict[str, int] = {}
-    for record in records:
-        if record.token_usage:
-            folder_tokens[record.folder] = folder_tokens.get(record.folder, 0) + record.token_usage.total_tokens
-
     if folder_tokens:
         console.print("[bold]Projects:[/bold]")
         total = sum(folder_tokens.values())
@@ -215,23 +232,16 @@ def _create_kpi_section(overall) -> Group:
     return Group(kpi_grid)
 
 
-def _create_model_breakdown(records: list[UsageRecord]) -> Panel:
+def _create_model_breakdown(model_tokens: dict[str, int]) -> Panel:
     """
     Create table showing token usage per model.
 
     Args:
-        records: List of usage records
+        model_tokens: Total tokens per model
 
     Returns:
         Panel with model breakdown table
     """
-    # Aggregate tokens by model
-    model_tokens: dict[str, int] = defaultdict(int)
-
-    for record in records:
-        if record.model and record.token_usage and record.model != "<synthetic>":
-            model_tokens[record.model] += record.token_usage.total_tokens
-
     if not model_tokens:
         return Panel(
             Text("No model data available", style=DIM),
@@ -278,23 +288,16 @@ def _create_model_breakdown(records: list[UsageRecord]) -> Panel:
     )
 
 
-def _create_project_breakdown(records: list[UsageRecord]) -> Panel:
+def _create_project_breakdown(folder_tokens: dict[str, int]) -> Panel:
     """
     Create table showing token usage per project.
 
     Args:
-        records: List of usage records
+        folder_tokens: Total tokens per project folder
 
     Returns:
         Panel with project breakdown table
     """
-    # Aggregate tokens by folder
-    folder_tokens: dict[str, int] = defaultdict(int)
-
-    for record in records:
-        if record.token_usage:
-            folder_tokens[record.folder] += record.token_usage.total_tokens
-
     if not folder_tokens:
         return Panel(
             Text("No project data available", style=DIM),
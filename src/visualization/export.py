@@ -64,7 +64,7 @@ def export_heatmap_svg(
     # Add all days from Jan 1 to Dec 31
     current_date = start_date
     while current_date <= end_date:
-        date_key = current_date.strftime("%Y-%m-%d")
+        date_key = current_date.isoformat()
         day_stats = stats.daily_stats.get(date_key)
         current_week.append((day_stats, current_date))
 
@@ -142,7 +142,7 @@ def export_heatmap_png(
 
     current_date = start_date
     while current_date <= end_date:
-        date_key = current_date.strftime("%Y-%m-%d")
+        date_key = current_date.isoformat()
         day_stats = stats.daily_stats.get(date_key)
         current_week.append((day_stats, current_date))
 
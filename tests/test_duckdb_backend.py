@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from src.storage import duckdb_backend  # noqa: E402
+
+
+def test_get_stale_files_reports_new_modified_and_deleted(tmp_path) -> None:
+    db_path = tmp_path / "usage.duckdb"
+    unchanged, grown, touched, deleted = (
+        tmp_path / f"{name}.jsonl" for name in ("unchanged", "grown", "touched", "deleted")
+    )
+    for file_path in (unchanged, grown, touched, deleted):
+        file_path.write_text("{}\n")
+    duckdb_backend.update_files_metadata([unchanged, grown, touched, deleted], db_path=db_path)
+
+    grown.write_text("{}\n{}\n")
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    deleted.unlink()
+    new = tmp_path / "new.jsonl"
+    new.write_text("{}\n")
+
+    stale_files, deleted_files = duckdb_backend.get_stale_files(
+        [new, unchanged, grown, touched], db_path=db_path
+    )
+
+    assert stale_files == [new, grown, touched]
+    assert deleted_files == [str(deleted)]
+
+
+
+def test_get_stale_files_short_circuits_on_empty_metadata_or_input(tmp_path) -> None:
+    db_path = tmp_path / "usage.duckdb"
+    tracked = tmp_path / "tracked.jsonl"
+    tracked.write_text("{}\n")
+    duckdb_backend.init_database(db_path)
+
+    assert duckdb_backend.get_stale_files([tracked], db_path=db_path) == ([tracked], [])
+
+    duckdb_backend.update_files_metadata([tracked], db_path=db_path)
+    assert duckdb_backend.get_stale_files([], db_path=db_path) == ([], [str(tracked)])
+
+def test_fill_empty_daily_snapshots_fills_inclusive_range_once(tmp_path) -> None:
+    db_path = tmp_path / "usage.duckdb"
+
+    assert duckdb_backend.fill_empty_daily_snapshots("2024-02-27", "2024-03-01", db_path=db_path) == 4
+    assert duckdb_backend.fill_empty_daily_snapshots("2024-02-26", "2024-03-01", db_path=db_path) == 1
+    assert duckdb_backend.fill_empty_daily_snapshots("2024-03-02", "2024-03-01", db_path=db_path) == 0
+
+    conn = duckdb.connect(str(db_path))
+    try:
+        rows = conn.execute(
+            "SELECT date, total_prompts, total_tokens FROM daily_snapshots ORDER BY date"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert rows == [
+        ("2024-02-26", 0, 0),
+        ("2024-02-27", 0, 0),
+        ("2024-02-28", 0, 0),
+        ("2024-02-29", 0, 0),
+        ("2024-03-01", 0, 0),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date"),
+    [("2024-02-30", "2024-03-01"), ("2024-03-01", "03/02/2024")],
+)
+def test_fill_empty_daily_snapshots_rejects_malformed_dates(tmp_path, start_date, end_date) -> None:
+    with pytest.raises(ValueError):
+        duckdb_backend.fill_empty_daily_snapshots(start_date, end_date, db_path=tmp_path / "usage.duckdb")
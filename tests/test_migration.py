@@ -0,0 +1,94 @@
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from src.models.usage_record import TokenUsage, UsageRecord  # noqa: E402
+from src.storage import duckdb_backend, migration, snapshot_db  # noqa: E402
+
+USAGE_QUERY = (
+    "SELECT date, timestamp, session_id, message_uuid, message_type, model, "
+    "input_tokens, output_tokens, total_tokens, device_id, device_name, device_type "
+    "FROM usage_records"
+)
+DAILY_QUERY = (
+    "SELECT date, total_prompts, total_responses, total_sessions, total_tokens, "
+    "device_id, device_name, device_type FROM daily_snapshots"
+)
+
+
+def _records() -> list[UsageRecord]:
+    return [
+        UsageRecord(
+            timestamp=datetime(2025, 3, 1 + i % 3, 12, i, tzinfo=timezone.utc),
+            session_id=f"s{i % 2}",
+            message_uuid=f"m{i}",
+            message_type="assistant" if i % 2 else "user",
+            model="claude-sonnet-4-5-20250929" if i % 2 else None,
+            folder="/tmp/project",
+            git_branch="main",
+            version="2.0.0",
+            token_usage=TokenUsage(i, 2 * i, 0, 0) if i % 2 else None,
+        )
+        for i in range(12)
+    ]
+
+
+def _save_kwargs() -> dict:
+    return {"storage_mode": "full", "device_id": "laptop", "device_name": "Laptop", "device_type": "linux"}
+
+
+def _sqlite_rows(db_path, query: str) -> list[tuple]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return sorted(conn.execute(query).fetchall())
+    finally:
+        conn.close()
+
+
+def _duckdb_rows(db_path, query: str) -> list[tuple]:
+    conn = duckdb.connect(str(db_path))
+    try:
+        return sorted(conn.execute(query).fetchall())
+    finally:
+        conn.close()
+
+
+def _attach_empty(duckdb_conn, sqlite_path, alias="src", read_only=True) -> bool:
+    # Stands in for a working sqlite extension whose per-table copy fails
+    duckdb_conn.execute(f"ATTACH ':memory:' AS {alias}")
+    return True
+
+
+@pytest.mark.parametrize("attach_fails_per_table", [False, True])
+def test_migrate_sqlite_to_duckdb_copies_row_sets(tmp_path, monkeypatch, attach_fails_per_table) -> None:
+    sqlite_path = tmp_path / "usage.db"
+    duckdb_path = tmp_path / "usage.duckdb"
+    snapshot_db.save_snapshot(_records(), db_path=sqlite_path, **_save_kwargs())
+    if attach_fails_per_table:
+        monkeypatch.setattr(migration, "_attach_sqlite", _attach_empty)
+
+    stats = migration.migrate_sqlite_to_duckdb(sqlite_path, duckdb_path, "other", "Other", "macos")
+
+    assert stats["errors"] == []
+    assert stats["usage_records"] == 12
+    for query in (USAGE_QUERY, DAILY_QUERY):
+        assert _duckdb_rows(duckdb_path, query) == _sqlite_rows(sqlite_path, query)
+
+
+@pytest.mark.parametrize("attached_copy_fails", [False, True])
+def test_migrate_duckdb_to_sqlite_copies_row_sets(tmp_path, monkeypatch, attached_copy_fails) -> None:
+    duckdb_path = tmp_path / "usage.duckdb"
+    sqlite_path = tmp_path / "usage.db"
+    duckdb_backend.save_snapshot(_records(), db_path=duckdb_path, **_save_kwargs())
+    if attached_copy_fails:
+        monkeypatch.setattr(migration, "_attach_sqlite", _attach_empty)
+
+    stats = migration.migrate_duckdb_to_sqlite(duckdb_path, sqlite_path, "other", "Other", "macos")
+
+    assert stats["errors"] == []
+    assert stats["usage_records"] == 12
+    for query in (USAGE_QUERY, DAILY_QUERY):
+        assert _sqlite_rows(sqlite_path, query) == _duckdb_rows(duckdb_path, query)
@@ -0,0 +1,111 @@
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+from src.models.usage_record import TokenUsage, UsageRecord
+from src.storage import snapshot_db
+
+
+def _record(day: int, session_id: str, message_uuid: str, output_tokens: int) -> UsageRecord:
+    return UsageRecord(
+        timestamp=datetime(2025, 3, day, 12, tzinfo=timezone.utc),
+        session_id=session_id,
+        message_uuid=message_uuid,
+        message_type="assistant",
+        model="claude-sonnet-4-5-20250929",
+        folder="/tmp/project",
+        git_branch="main",
+        version="2.0.0",
+        token_usage=TokenUsage(10, output_tokens, 0, 0),
+    )
+
+
+def _daily_snapshots(db_path) -> dict:
+    conn = sqlite3.connect(db_path)
+    try:
+        return {
+            row[0]: row[1:]
+            for row in conn.execute(
+                "SELECT date, total_responses, total_sessions, total_tokens, output_tokens "
+                "FROM daily_snapshots"
+            )
+        }
+    finally:
+        conn.close()
+
+
+def _recomputed(db_path) -> dict:
+    conn = sqlite3.connect(db_path)
+    try:
+        return {
+            row[0]: row[1:]
+            for row in conn.execute(
+                "SELECT date, COUNT(*), COUNT(DISTINCT session_id), "
+                "SUM(total_tokens), SUM(output_tokens) "
+                "FROM usage_records GROUP BY date"
+            )
+        }
+    finally:
+        conn.close()
+
+
+def test_save_snapshot_overlapping_batches_match_full_recompute(tmp_path) -> None:
+    db_path = tmp_path / "usage.db"
+
+    snapshot_db.save_snapshot(
+        [_record(1, "s1", "m1", 5), _record(1, "s1", "m2", 7), _record(3, "s1", "m3", 1)],
+        db_path=db_path,
+        storage_mode="full",
+    )
+    # A forked session replays m1 two days later with the final usage: the
+    # stored 2025-03-01 row is upgraded although the batch only spans 03-03.
+    snapshot_db.save_snapshot(
+        [_record(3, "s2", "m1", 50), _record(3, "s2", "m4", 2)],
+        db_path=db_path,
+        storage_mode="full",
+    )
+
+    assert _daily_snapshots(db_path) == _recomputed(db_path)
+    assert _daily_snapshots(db_path)[_record(1, "s1", "m1", 0).date_key][3] == 57
+
+
+def test_get_stale_files_reports_new_modified_and_deleted(tmp_path) -> None:
+    db_path = tmp_path / "usage.db"
+    unchanged, grown, touched, deleted = (
+        tmp_path / f"{name}.jsonl" for name in ("unchanged", "grown", "touched", "deleted")
+    )
+    for file_path in (unchanged, grown, touched, deleted):
+        file_path.write_text("{}\n")
+    snapshot_db.update_files_metadata([unchanged, grown, touched, deleted], db_path=db_path)
+
+    grown.write_text("{}\n{}\n")
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    deleted.unlink()
+    new = tmp_path / "new.jsonl"
+    new.write_text("{}\n")
+
+    stale_files, deleted_files = snapshot_db.get_stale_files(
+        [new, unchanged, grown, touched], db_path=db_path
+    )
+
+    assert stale_files == [new, grown, touched]
+    assert deleted_files == [str(deleted)]
+
+
+def test_get_database_stats_cache_invalidated_by_write(tmp_path) -> None:
+    db_path = tmp_path / "usage.db"
+    snapshot_db.save_snapshot(
+        [_record(1, "s1", f"a{i}", 1) for i in range(5)], db_path=db_path, storage_mode="full"
+    )
+    assert snapshot_db.get_database_stats(db_path)["total_records"] == 5
+
+    # Enough rows to grow the file, so the cache key changes even when the
+    # write lands within the filesystem's mtime granularity
+    snapshot_db.save_snapshot(
+        [_record(2, "s2", f"b{i}", 1) for i in range(500)], db_path=db_path, storage_mode="full"
+    )
+    stats = snapshot_db.get_database_stats(db_path)
+
+    assert stats["total_records"] == 505
+    assert stats["total_days"] == 2